@@ -0,0 +1,74 @@
+"""store enums as varchar
+
+Revision ID: 2f787ff7ffdf
+Revises: 113c78a2c928
+Create Date: 2026-10-15 23:19:55.416011
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = '2f787ff7ffdf'
+down_revision = '113c78a2c928'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.alter_column(
+        'job_application',
+        'status',
+        type_=sa.String(length=32),
+        existing_nullable=False,
+        postgresql_using='status::text',
+    )
+    op.execute("DROP TYPE job_application_status_enum")
+
+    op.alter_column('user', 'role', server_default=None)
+    op.alter_column(
+        'user',
+        'role',
+        type_=sa.String(length=32),
+        existing_nullable=False,
+        postgresql_using='role::text',
+    )
+    op.alter_column('user', 'role', server_default='APPLICANT')
+    op.execute("DROP TYPE userroleenum")
+
+
+def downgrade():
+    bind = op.get_bind()
+
+    user_role_enum = sa.Enum('COMPANY', 'APPLICANT', name='userroleenum')
+    user_role_enum.create(bind)
+    op.alter_column('user', 'role', server_default=None)
+    op.alter_column(
+        'user',
+        'role',
+        type_=user_role_enum,
+        existing_nullable=False,
+        postgresql_using='role::userroleenum',
+    )
+    op.alter_column('user', 'role', server_default='APPLICANT')
+
+    status_enum = sa.Enum(
+        'SUBMITTED',
+        'UNDER_REVIEW',
+        'INTERVIEW',
+        'ACCEPTED',
+        'REJECTED',
+        'WITHDRAWN',
+        'TEST',
+        name='job_application_status_enum',
+    )
+    status_enum.create(bind)
+    op.alter_column(
+        'job_application',
+        'status',
+        type_=status_enum,
+        existing_nullable=False,
+        postgresql_using='status::job_application_status_enum',
+    )
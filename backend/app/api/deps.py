@@ -19,7 +19,9 @@ reusable_oauth2 = OAuth2PasswordBearer(
 
 
 def get_db() -> Generator[Session, None, None]:
-    with Session(engine) as session:
+    # Keep loaded attributes valid after commit; every column default is set
+    # client-side, so committed objects do not need to be re-read.
+    with Session(engine, expire_on_commit=False) as session:
         yield session
 
 
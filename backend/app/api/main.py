@@ -7,6 +7,7 @@ from app.services.files import routes as files
 from app.services.jobs import routes as jobs
 from app.services.resumes import routes as resumes
 from app.services.screens import routes as screens
+from app.services.uploads import routes as uploads
 
 api_router = APIRouter()
 api_router.include_router(login.router)
@@ -17,5 +18,6 @@ api_router.include_router(files.router)
 api_router.include_router(jobs.router)
 api_router.include_router(resumes.router)
 api_router.include_router(screens.router)
+api_router.include_router(uploads.router)
 if settings.ENVIRONMENT == "local":
     api_router.include_router(private.router)
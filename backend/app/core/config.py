@@ -40,6 +40,7 @@ class Settings(BaseSettings):
 
     OPENAI_LLM: str = ""
     OPENAI_API_KEY: str = ""
+    LLM_MAX_CONCURRENCY: int = 8
 
     BACKEND_CORS_ORIGINS: Annotated[
         list[AnyUrl] | str, BeforeValidator(parse_cors)
@@ -59,8 +60,21 @@ class Settings(BaseSettings):
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str = ""
     POSTGRES_DB: str = ""
+    # Each backend worker process has its own pool, so workers * (size +
+    # overflow) must stay below Postgres' max_connections (100 by default).
+    SQL_POOL_SIZE: int = 10
+    SQL_MAX_OVERFLOW: int = 10
+    SQL_POOL_TIMEOUT: int = 30
+    SQL_POOL_RECYCLE: int = 3600
 
     STORAGE_ROOT: str = ""
+    # Request bodies above this size are rejected with 413 before parsing.
+    MAX_UPLOAD_BYTES: int = 25 * 1024 * 1024
+    # Server worker processes; keep in step with --workers in the Dockerfile.
+    BACKEND_WORKERS: int = 4
+    # Processes in each worker's PDF extraction pool. Unset, the CPUs are shared
+    # evenly between the server workers.
+    PDF_WORKERS: int | None = None
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -1,10 +1,30 @@
+from typing import Any
+
+from pydantic_core import from_json, to_json
 from sqlmodel import Session, create_engine, select
 
 from app import crud
 from app.core.config import settings
 from app.models import User, UserCreate
 
-engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+
+def _json_serializer(value: Any) -> str:
+    # pydantic_core encodes nested pydantic models directly, so JSON columns can
+    # bind models without dumping them to dicts first.
+    return to_json(value).decode()
+
+
+engine = create_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI),
+    json_serializer=_json_serializer,
+    # The Rust JSON parser also decodes JSON columns faster than the stdlib.
+    json_deserializer=from_json,
+    pool_size=settings.SQL_POOL_SIZE,
+    max_overflow=settings.SQL_MAX_OVERFLOW,
+    pool_timeout=settings.SQL_POOL_TIMEOUT,
+    pool_recycle=settings.SQL_POOL_RECYCLE,
+    pool_pre_ping=True,
+)
 
 
 # make sure all SQLModel models are imported (app.models) before initializing DB
@@ -1,11 +1,21 @@
-from typing import Annotated
+import asyncio
+import hashlib
+import weakref
+from typing import Annotated, Any
 
+from cachetools import TTLCache
 from fastapi import Depends
-from pydantic_ai import Agent
-from pydantic_ai.models.openai import OpenAIChatModel
+from pydantic_ai import Agent, NativeOutput, RunContext
+from pydantic_ai.exceptions import UnexpectedModelBehavior
+from pydantic_ai.models.openai import OpenAIChatModel, OpenAIChatModelSettings
 from pydantic_ai.providers.openai import OpenAIProvider
 
 from app.core.config import settings
+from app.models import (
+    JobApplicationScreenAgentPayload,
+    JobListing,
+    JobListingParseResponse,
+)
 
 _model = OpenAIChatModel(
     settings.OPENAI_LLM,
@@ -20,8 +30,82 @@ SCREEN_PROMPT = """You evaluate how well a resume aligns with a job listing.
 For each qualification, assign a status of HIGHLY_QUALIFIED, QUALIFIED, MEETS, or NOT_QUALIFIED and explain why.
 The ScreeningReason must match one to one with the minimum requirements and the preferred requirements. the order matters."""
 
-_job_agent = Agent(model=_model, system_prompt=JOB_PROMPT)
-_screen_agent = Agent(model=_model, system_prompt=SCREEN_PROMPT)
+# Bump whenever a prompt changes so cached results are not reused.
+JOB_PROMPT_VERSION = "1"
+SCREEN_PROMPT_VERSION = "1"
+
+SCREEN_BATCH_PROMPT = f"""{SCREEN_PROMPT}
+You receive a single job listing followed by a numbered list of resumes.
+Return exactly one result per resume and set resume_index to the number of the resume it evaluates."""
+
+
+class _ScreenBatchItem(JobApplicationScreenAgentPayload):
+    """One batched screening result, tagged with the resume it evaluates."""
+
+    resume_index: int
+
+
+# Screening output is requested as a strict JSON schema response format, so the
+# provider constrains decoding to the payload schema instead of the model
+# occasionally emitting malformed JSON that costs a validation retry.
+_SCREEN_OUTPUT = NativeOutput(JobApplicationScreenAgentPayload, strict=True)
+_SCREEN_BATCH_OUTPUT = NativeOutput(list[_ScreenBatchItem], name="screens", strict=True)
+
+# Output types are fixed on the agents rather than passed per run, so
+# pydantic-ai builds each output schema and validator once at import.
+_job_agent = Agent(
+    model=_model, system_prompt=JOB_PROMPT, output_type=JobListingParseResponse
+)
+# Screening agents take the rendered job listing as deps and append it to the
+# system prompt, so every request for a listing starts with the same prefix and
+# the provider's prompt cache only has to prefill the resume tokens.
+_screen_agent = Agent(
+    model=_model,
+    system_prompt=SCREEN_PROMPT,
+    deps_type=str,
+    output_type=_SCREEN_OUTPUT,
+)
+_screen_batch_agent = Agent(
+    model=_model,
+    system_prompt=SCREEN_BATCH_PROMPT,
+    deps_type=str,
+    output_type=_SCREEN_BATCH_OUTPUT,
+)
+
+
+@_screen_agent.system_prompt
+@_screen_batch_agent.system_prompt
+def _job_listing_context(ctx: RunContext[str]) -> str:
+    return ctx.deps
+
+
+# Caps in-flight LLM requests so fan-outs stay under provider rate limits. A
+# semaphore binds to the event loop that first waits on it, so there is one per
+# loop, created on first use rather than at import.
+_llm_semaphores: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, asyncio.Semaphore
+] = weakref.WeakKeyDictionary()
+
+
+def _llm_semaphore() -> asyncio.Semaphore:
+    """Return the LLM concurrency limit for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _llm_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(settings.LLM_MAX_CONCURRENCY)
+        _llm_semaphores[loop] = semaphore
+    return semaphore
+
+
+# Screening is deterministic for a given prompt, listing, and resume, so repeat
+# screenings within the TTL are served without another LLM round-trip.
+_screen_cache: TTLCache[str, JobApplicationScreenAgentPayload] = TTLCache(
+    maxsize=10_000, ttl=3600
+)
+
+# Parsing is deterministic on the raw text, so re-parsing an unchanged draft
+# (e.g. a preview after a no-op edit) is served from memory.
+_job_cache: TTLCache[str, JobListingParseResponse] = TTLCache(maxsize=1024, ttl=86400)
 
 
 def get_job_agent() -> Agent:
@@ -32,5 +116,158 @@ def get_screen_agent() -> Agent:
     return _screen_agent
 
 
+def _job_listing_prompt(job_listing: JobListing) -> str:
+    """Render the job listing fields the screening agent evaluates against."""
+    job_listing_input: dict[str, Any] = {
+        "title": job_listing.title,
+        "description": job_listing.description,
+        "minimum_qualifications": job_listing.minimum_qualifications,
+        "preferred_qualifications": job_listing.preferred_qualifications,
+    }
+    return f"JOB LISTING:\n{job_listing_input}"
+
+
+def _job_cache_key(text: str) -> str:
+    return hashlib.blake2b(
+        f"{JOB_PROMPT_VERSION}\0{text}".encode(), digest_size=16
+    ).hexdigest()
+
+
+def _screen_cache_key(job_listing_prompt: str, resume_text: str) -> str:
+    return hashlib.blake2b(
+        f"{SCREEN_PROMPT_VERSION}\0{job_listing_prompt}\0{resume_text}".encode(),
+        digest_size=16,
+    ).hexdigest()
+
+
+def _screen_settings(job_listing_prompt: str) -> OpenAIChatModelSettings:
+    """
+    Route screenings of one listing to the same provider prompt cache.
+
+    Requests for a listing share the system prompt and listing as a prefix, and
+    a common ``prompt_cache_key`` keeps them on the cache that already holds it.
+    """
+    listing_key = hashlib.blake2b(job_listing_prompt.encode(), digest_size=8)
+    return OpenAIChatModelSettings(
+        extra_body={"prompt_cache_key": f"screen-{listing_key.hexdigest()}"}
+    )
+
+
+def screen_input_hash(job_listing: JobListing, resume_text: str) -> str:
+    """Fingerprint the inputs of a screening so stored results can be reused."""
+    return _screen_cache_key(_job_listing_prompt(job_listing), resume_text)
+
+
+async def arun_job(text: str, *, agent: Agent | None = None) -> JobListingParseResponse:
+    """Parse raw job listing text into a structured listing."""
+    cache_key = _job_cache_key(text)
+    cached = _job_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    async with _llm_semaphore():
+        result = await (agent or _job_agent).run(text)
+    _job_cache[cache_key] = result.output
+    return result.output
+
+
+async def arun_screen(
+    job_listing: JobListing,
+    resume_text: str,
+    *,
+    agent: Agent | None = None,
+) -> JobApplicationScreenAgentPayload:
+    """Screen a single resume against a job listing."""
+    job_listing_prompt = _job_listing_prompt(job_listing)
+    cache_key = _screen_cache_key(job_listing_prompt, resume_text)
+    cached = _screen_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    async with _llm_semaphore():
+        result = await (agent or _screen_agent).run(
+            user_prompt=f"RESUME:\n{resume_text}",
+            deps=job_listing_prompt,
+            model_settings=_screen_settings(job_listing_prompt),
+        )
+    _screen_cache[cache_key] = result.output
+    return result.output
+
+
+async def _screen_uncached(
+    job_listing: JobListing, resume_texts: list[str]
+) -> list[JobApplicationScreenAgentPayload]:
+    """
+    Screen resumes in one batched request, falling back to one per resume.
+
+    Results are matched to resumes by their ``resume_index`` rather than by
+    position, and the batch is discarded unless every resume is answered
+    exactly once.
+    """
+    resume_sections = [
+        f"RESUME {index}:\n{resume_text}"
+        for index, resume_text in enumerate(resume_texts, start=1)
+    ]
+
+    job_listing_prompt = _job_listing_prompt(job_listing)
+    try:
+        async with _llm_semaphore():
+            result = await _screen_batch_agent.run(
+                user_prompt="\n\n".join(resume_sections),
+                deps=job_listing_prompt,
+                model_settings=_screen_settings(job_listing_prompt),
+            )
+    except UnexpectedModelBehavior:
+        pass
+    else:
+        by_index = {item.resume_index: item for item in result.output}
+        expected = range(1, len(resume_texts) + 1)
+        if len(result.output) == len(resume_texts) and by_index.keys() == set(expected):
+            return [
+                JobApplicationScreenAgentPayload.model_validate(
+                    by_index[index].model_dump(exclude={"resume_index"})
+                )
+                for index in expected
+            ]
+
+    # Screen the first resume on its own to warm the provider's prefix cache
+    # for this listing before the remaining requests fan out.
+    first, *rest = resume_texts
+    screens = [await arun_screen(job_listing, first)]
+    screens.extend(
+        await asyncio.gather(*(arun_screen(job_listing, text) for text in rest))
+    )
+    return screens
+
+
+async def screen_batch(
+    job_listing: JobListing, resume_texts: list[str]
+) -> list[JobApplicationScreenAgentPayload]:
+    """
+    Screen several resumes against one job listing in a single request.
+
+    The job listing is sent first so its tokens form a shared prefix that is
+    only prefilled once. Resumes with a cached result are skipped. Falls back to
+    one request per resume when the batched output fails validation or does
+    not answer every resume exactly once.
+    """
+    job_listing_prompt = _job_listing_prompt(job_listing)
+    cache_keys = [
+        _screen_cache_key(job_listing_prompt, resume_text)
+        for resume_text in resume_texts
+    ]
+    screens = [_screen_cache.get(cache_key) for cache_key in cache_keys]
+    pending = [index for index, screen in enumerate(screens) if screen is None]
+
+    if pending:
+        fresh = await _screen_uncached(
+            job_listing, [resume_texts[index] for index in pending]
+        )
+        for index, screen in zip(pending, fresh, strict=True):
+            screens[index] = _screen_cache[cache_keys[index]] = screen
+
+    return [screen for screen in screens if screen is not None]
+
+
 JobAgentDep = Annotated[Agent, Depends(get_job_agent)]
 ScreenAgentDep = Annotated[Agent, Depends(get_screen_agent)]
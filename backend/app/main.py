@@ -1,25 +1,70 @@
+import atexit
+import logging
+import queue
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
+
 import sentry_sdk
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.routing import APIRoute
 from starlette.middleware.cors import CORSMiddleware
 
 from app.api.main import api_router
 from app.core.config import settings
+from app.core.middleware import BodySizeLimitMiddleware
+from app.services.parsers.parsers import (
+    prewarm_pdf_executor,
+    shutdown_pdf_executor,
+)
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
     return f"{route.tags[0]}-{route.name}"
 
 
+def _offload_log_handlers() -> None:
+    """
+    Route root log records through a queue so handlers write from a background
+    thread instead of blocking request handling on stream I/O.
+    """
+    root = logging.getLogger()
+    if not root.handlers:
+        return
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    atexit.register(listener.stop)
+
+
+_offload_log_handlers()
+
 if settings.SENTRY_DSN and settings.ENVIRONMENT != "local":
     sentry_sdk.init(dsn=str(settings.SENTRY_DSN), enable_tracing=True)
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # Parser modules are already imported with the routes; the PDF worker
+    # processes are started here so the first upload finds them warm.
+    await run_in_threadpool(prewarm_pdf_executor)
+    yield
+    shutdown_pdf_executor()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
+    lifespan=lifespan,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
 )
 
+# Added before CORS so that CORS wraps it and its 413 responses carry CORS headers.
+app.add_middleware(BodySizeLimitMiddleware, max_body_size=settings.MAX_UPLOAD_BYTES)
+
 # Set all CORS enabled origins
 if settings.all_cors_origins:
     app.add_middleware(
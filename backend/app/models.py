@@ -1,7 +1,9 @@
 import uuid
+from collections.abc import Callable
 from datetime import date, datetime, timezone
 from decimal import Decimal
 from enum import Enum
+from functools import partial
 
 from pydantic import EmailStr, Field as PydanticField
 from sqlalchemy import (
@@ -10,6 +12,7 @@ from sqlalchemy import (
     Date,
     DateTime,
     Float,
+    Index,
     Numeric,
     Text,
     UniqueConstraint,
@@ -21,9 +24,9 @@ from sqlmodel import Field, Relationship, SQLModel
 from app.core.utils import MakeOptional
 
 
-def _utcnow() -> datetime:
-    """Return a timezone-aware UTC timestamp."""
-    return datetime.now(timezone.utc)
+# Timezone-aware UTC timestamp factory. A partial binds the tz once and runs
+# without a Python frame, which adds up on bulk inserts.
+_utcnow: Callable[[], datetime] = partial(datetime.now, timezone.utc)
 
 
 class UserRoleEnum(str, Enum):
@@ -76,8 +79,8 @@ class User(UserBase, table=True):
         sa_column=Column(
             SQLAlchemyEnum(
                 UserRoleEnum,
-                name="userroleenum",
-                create_type=False,
+                native_enum=False,
+                length=32,
             ),
             nullable=False,
         ),
@@ -104,13 +107,20 @@ class FileBase(SQLModel):
     filename: str = Field(index=True, max_length=255)
     content_type: str = Field(max_length=100)
     size_bytes: int = Field(ge=0)
-    storage_key: str = Field(index=True, unique=True)
+    storage_key: str = Field(index=True)
+    sha256: str | None = Field(default=None, index=True, max_length=64)
     owner_id: uuid.UUID = Field(nullable=False, foreign_key="user.id")
 
 
 class File(FileBase, table=True):
     """Database model for file metadata."""
 
+    # Storage is content addressed, so owners share objects but each owner
+    # holds at most one row per object.
+    __table_args__ = (
+        UniqueConstraint("storage_key", "owner_id", name="uq_file_storage_key_owner"),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     created_at: datetime = Field(default_factory=_utcnow, nullable=False)
     updated_at: datetime = Field(default_factory=_utcnow, nullable=False)
@@ -122,23 +132,23 @@ class ResumeBase(SQLModel):
     user_id: uuid.UUID = Field(
         nullable=False,
         foreign_key="user.id",
-        index=True,
     )
     file_id: uuid.UUID = Field(
         nullable=False,
         foreign_key="file.id",
         unique=True,
     )
-    text_content: str = Field(
-        default="",
-        sa_column=Column(Text, nullable=False),
-    )
 
 
 class Resume(ResumeBase, table=True):
     """Database model for stored resumes."""
 
     __tablename__ = "resume"
+    __table_args__ = (
+        # Backs the newest-first resume list of each user and plain lookups by
+        # user, so user_id carries no separate single-column index.
+        Index("ix_resume_user_created", "user_id", "created_at"),
+    )
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     created_at: datetime = Field(
@@ -151,6 +161,31 @@ class Resume(ResumeBase, table=True):
     )
 
     applications: list["JobApplication"] = Relationship(back_populates="resume")
+    # The parsed text lives in its own table so that listing, joining, and
+    # counting resumes does not read it.
+    content: "ResumeText" = Relationship(
+        sa_relationship_kwargs={
+            "uselist": False,
+            "cascade": "all, delete-orphan",
+            "passive_deletes": True,
+        }
+    )
+
+    @property
+    def text_content(self) -> str:
+        """Parsed text of the resume, loaded on first access."""
+        return self.content.text if self.content else ""
+
+
+class ResumeText(SQLModel, table=True):
+    """Parsed text content of a resume."""
+
+    __tablename__ = "resume_text"
+
+    resume_id: uuid.UUID = Field(
+        foreign_key="resume.id", primary_key=True, ondelete="CASCADE"
+    )
+    text: str = Field(default="", sa_column=Column(Text, nullable=False))
 
 
 class ResumeRead(ResumeBase):
@@ -159,6 +194,8 @@ class ResumeRead(ResumeBase):
     id: uuid.UUID
     created_at: datetime
     updated_at: datetime
+    # Omitted when the text was not requested.
+    text_content: str | None = None
 
 
 class JobTypeEnum(str, Enum):
@@ -202,12 +239,15 @@ class JobListing(JobListingBase, table=True):
     """Database model for job listings."""
 
     __tablename__ = "job_listing"
+    # Also covers lookups by company_id alone.
+    __table_args__ = (
+        Index("ix_job_listing_company_active", "company_id", "is_active"),
+    )
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     company_id: uuid.UUID = Field(
         foreign_key="user.id",
         nullable=False,
-        index=True,
     )
     posted_on: datetime = Field(
         default_factory=_utcnow,
@@ -266,7 +306,6 @@ class JobApplicationBase(SQLModel):
     job_listing_id: uuid.UUID = Field(
         nullable=False,
         foreign_key="job_listing.id",
-        index=True,
     )
     resume_id: uuid.UUID | None = Field(
         default=None,
@@ -288,20 +327,25 @@ class JobApplication(JobApplicationBase, table=True):
             "applicant_id",
             name="uq_job_application_listing_applicant",
         ),
+        # Back the newest-first application lists for applicants and companies.
+        # They also serve plain lookups by applicant or listing, so those columns
+        # carry no separate single-column indexes.
+        Index("ix_job_application_applicant_created", "applicant_id", "created_at"),
+        Index("ix_job_application_listing_created", "job_listing_id", "created_at"),
     )
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     applicant_id: uuid.UUID = Field(
         nullable=False,
         foreign_key="user.id",
-        index=True,
     )
     status: JobApplicationStatusEnum = Field(
         default=JobApplicationStatusEnum.SUBMITTED,
         sa_column=Column(
             SQLAlchemyEnum(
                 JobApplicationStatusEnum,
-                name="job_application_status_enum",
+                native_enum=False,
+                length=32,
             ),
             nullable=False,
         ),
@@ -334,7 +378,7 @@ class JobApplicationRead(JobApplicationBase):
     status: JobApplicationStatusEnum
     created_at: datetime
     updated_at: datetime
-    resume: "Resume | None"
+    resume: ResumeRead | None
     applicant: User
     screen: "JobApplicationScreen | None"
     job_listing: JobListing
@@ -363,18 +407,23 @@ class ScreeningReasonListType(TypeDecorator):
     cache_ok = True
 
     def process_bind_param(self, value, dialect):
+        # ScreeningReason models are bound as-is; the engine's JSON serializer
+        # encodes them together with the list in a single pass.
         if value is None:
             return []
-        return [
-            reason.model_dump() if isinstance(reason, ScreeningReason) else reason
-            for reason in value
-        ]
+        return value
 
     def process_result_value(self, value, dialect):
+        # Stored reasons were validated when written, so skip re-validation.
         if value is None:
             return []
         return [
-            reason if isinstance(reason, ScreeningReason) else ScreeningReason(**reason)
+            reason
+            if isinstance(reason, ScreeningReason)
+            else ScreeningReason.model_construct(
+                status=ScreeningReasonStatusEnum(reason["status"]),
+                reason=reason["reason"],
+            )
             for reason in value
         ]
 
@@ -408,9 +457,15 @@ class JobApplicationScreen(JobApplicationScreenBase, table=True):
         UniqueConstraint(
             "application_id", name="uq_job_application_screen_application"
         ),
+        # Screen lists are returned newest first.
+        Index("ix_job_application_screen_created_at", "created_at"),
     )
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    # Fingerprint of the listing and resume text the agent screened, so an
+    # identical pair on another application reuses the result. Cleared when
+    # the results are edited by hand.
+    input_hash: str | None = Field(default=None, max_length=64, index=True)
     created_at: datetime = Field(
         default_factory=_utcnow,
         sa_column=Column(DateTime(timezone=True), nullable=False),
@@ -1,48 +1,97 @@
 from __future__ import annotations
 
+import threading
+from collections.abc import Iterator
 from datetime import datetime, timezone
-from typing import Annotated, ClassVar
+from typing import Annotated, ClassVar, NamedTuple
 from uuid import UUID
 
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
+from sqlalchemy import Row, and_, func, lambda_stmt, literal, or_, true, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import aliased, contains_eager, selectinload
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlmodel import Session, select
 
 from app.api.deps import SessionDep
 from app.models import User, UserRoleEnum
 from app.services.applications.models import (
     JobApplication,
+    JobApplicationBulkStatusResult,
     JobApplicationCreate,
     JobApplicationStatusEnum,
 )
 from app.services.jobs.models import JobListing
 from app.services.resumes.models import Resume
 
+# Relationships serialized by JobApplicationRead, loaded up front so listing
+# applications does not issue a lazy SELECT per row and relationship. The job
+# listing is loaded per query, from the join when one is already present.
+_READ_LOAD_OPTIONS = (
+    selectinload(JobApplication.resume).selectinload(Resume.content),
+    selectinload(JobApplication.applicant),
+    selectinload(JobApplication.screen),
+)
+
+
+class _ListingAccess(NamedTuple):
+    company_id: UUID
+
+
+# Listing ownership changes rarely, so it is memoized briefly across requests
+# instead of re-selecting the listing on every transition. Whether a listing
+# accepts applications is always checked against the database.
+_listing_access_cache: TTLCache[UUID, _ListingAccess] = TTLCache(maxsize=1024, ttl=30)
+# Routes run in the threadpool and cachetools caches are not thread-safe.
+_listing_access_lock = threading.Lock()
+
 
 class JobApplicationService:
     """Application service encapsulating job application workflows."""
 
-    _STATUS_TRANSITIONS: ClassVar[dict[JobApplicationStatusEnum, set[JobApplicationStatusEnum]]] = {
-        JobApplicationStatusEnum.SUBMITTED: {
-            JobApplicationStatusEnum.UNDER_REVIEW,
-            JobApplicationStatusEnum.REJECTED,
-        },
-        JobApplicationStatusEnum.UNDER_REVIEW: {
-            JobApplicationStatusEnum.INTERVIEW,
-            JobApplicationStatusEnum.REJECTED,
-        },
-        JobApplicationStatusEnum.INTERVIEW: {
+    _STATUS_TRANSITIONS: ClassVar[
+        dict[JobApplicationStatusEnum, frozenset[JobApplicationStatusEnum]]
+    ] = {
+        JobApplicationStatusEnum.SUBMITTED: frozenset(
+            {
+                JobApplicationStatusEnum.UNDER_REVIEW,
+                JobApplicationStatusEnum.REJECTED,
+            }
+        ),
+        JobApplicationStatusEnum.UNDER_REVIEW: frozenset(
+            {
+                JobApplicationStatusEnum.INTERVIEW,
+                JobApplicationStatusEnum.REJECTED,
+            }
+        ),
+        JobApplicationStatusEnum.INTERVIEW: frozenset(
+            {
+                JobApplicationStatusEnum.ACCEPTED,
+                JobApplicationStatusEnum.REJECTED,
+            }
+        ),
+    }
+    _ALLOWED_PAIRS: ClassVar[
+        frozenset[tuple[JobApplicationStatusEnum, JobApplicationStatusEnum]]
+    ] = frozenset(
+        (current, target)
+        for current, targets in _STATUS_TRANSITIONS.items()
+        for target in targets
+    )
+    _TERMINAL_STATUSES: ClassVar[frozenset[JobApplicationStatusEnum]] = frozenset(
+        {
             JobApplicationStatusEnum.ACCEPTED,
             JobApplicationStatusEnum.REJECTED,
-        },
-    }
-    _TERMINAL_STATUSES: ClassVar[set[JobApplicationStatusEnum]] = {
-        JobApplicationStatusEnum.ACCEPTED,
-        JobApplicationStatusEnum.REJECTED,
-        JobApplicationStatusEnum.WITHDRAWN,
-    }
+            JobApplicationStatusEnum.WITHDRAWN,
+        }
+    )
 
     def __init__(self, session: Session) -> None:
         self._session = session
+        # Request-scoped memo of get_application results keyed by
+        # (requester_id, application_id); None records a denied lookup.
+        self._access_cache: dict[tuple[UUID, UUID], JobApplication | None] = {}
 
     def submit_application(
         self,
@@ -59,81 +108,88 @@ class JobApplicationService:
                 detail="Only applicants may submit job applications.",
             )
 
-        job_listing = self._session.get(JobListing, application_in.job_listing_id)
-        if not job_listing:
+        job_application = JobApplication.model_validate(
+            application_in,
+            update={"applicant_id": applicant.id},
+        )
+
+        try:
+            submission = self._insert_submission(job_application, applicant)
+            self._session.commit()
+        except Exception as exc:  # pragma: no cover - re-raised as HTTP error
+            self._session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to submit job application: {exc}",
+            ) from exc
+
+        if submission is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Job listing not found.",
             )
-        if not job_listing.is_active:
+        with _listing_access_lock:
+            _listing_access_cache[job_application.job_listing_id] = _ListingAccess(
+                submission.company_id
+            )
+        if not submission.accepting_applications:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Job listing is no longer accepting applications.",
             )
 
         if application_in.resume_id is not None:
-            resume = self._session.get(Resume, application_in.resume_id)
-            if not resume:
+            if submission.resume_owner_id is None:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Resume not found.",
                 )
-            if not applicant.is_superuser and resume.user_id != applicant.id:
+            if (
+                not applicant.is_superuser
+                and submission.resume_owner_id != applicant.id
+            ):
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail="Cannot submit a resume that belongs to another user.",
                 )
 
-        existing_statement = select(JobApplication).where(
-            JobApplication.job_listing_id == application_in.job_listing_id,
-            JobApplication.applicant_id == applicant.id,
-        )
-        if self._session.exec(existing_statement).first():
+        if submission.created is None:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="You have already applied to this job listing.",
             )
+        return submission.created
 
-        job_application = JobApplication.model_validate(
-            application_in,
-            update={"applicant_id": applicant.id},
-        )
-
-        try:
-            self._session.add(job_application)
-            self._session.commit()
-            self._session.refresh(job_application)
-            return job_application
-        except Exception as exc:  # pragma: no cover - re-raised as HTTP error
-            self._session.rollback()
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to submit job application: {exc}",
-            ) from exc
-
-    def list_applications(self, *, requester: User) -> list[JobApplication]:
-        """
-        Return job applications visible to the requester.
+    def list_applications(
+        self,
+        *,
+        requester: User,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: datetime | None = None,
+    ) -> list[JobApplication]:
         """
-        base_query = select(JobApplication).order_by(JobApplication.created_at.desc())
+        Return job applications visible to the requester, newest first.
 
-        if requester.is_superuser:
-            return list(self._session.exec(base_query))
+        Pass the ``created_at`` of the last application from the previous page as
+        ``cursor`` to page by key instead of scanning past ``skip`` rows.
+        """
+        statement = self._visible_applications_query(requester)
+        if cursor is not None:
+            statement += lambda s: s.where(JobApplication.created_at < cursor)
+        statement += lambda s: s.offset(skip).limit(limit)
+        return list(self._session.scalars(statement))
 
-        if requester.role == UserRoleEnum.COMPANY:
-            company_query = (
-                select(JobApplication)
-                .join(
-                    JobListing,
-                    JobListing.id == JobApplication.job_listing_id,
-                )
-                .where(JobListing.company_id == requester.id)
-                .order_by(JobApplication.created_at.desc())
-            )
-            return list(self._session.exec(company_query))
+    def export_applications(self, *, requester: User) -> Iterator[JobApplication]:
+        """
+        Yield every job application visible to the requester, newest first.
 
-        applicant_query = base_query.where(JobApplication.applicant_id == requester.id)
-        return list(self._session.exec(applicant_query))
+        Rows are fetched in batches so memory stays bounded for large exports.
+        """
+        yield from self._session.scalars(
+            self._visible_applications_query(requester),
+            execution_options={"yield_per": 500},
+        )
 
     def get_application(
         self, *, application_id: UUID, requester: User
@@ -141,27 +197,52 @@ class JobApplicationService:
         """
         Retrieve a single job application if the requester is authorized.
         """
-        application = self._session.get(JobApplication, application_id)
-        if not application:
+        cache_key = (requester.id, application_id)
+        if cache_key in self._access_cache:
+            return self._authorized_application(self._access_cache[cache_key])
+
+        # Resolve the application and the requester's access to it in one query.
+        # Built as a lambda statement so the construct is cached across requests.
+        requester_id = requester.id
+        statement = lambda_stmt(
+            lambda: (
+                select(
+                    JobApplication,
+                    or_(
+                        JobApplication.applicant_id == requester_id,
+                        JobListing.company_id == requester_id,
+                    ),
+                )
+                .join(JobListing, JobListing.id == JobApplication.job_listing_id)
+                .where(JobApplication.id == application_id)
+                .options(
+                    contains_eager(JobApplication.job_listing),
+                    selectinload(JobApplication.resume).selectinload(Resume.content),
+                    selectinload(JobApplication.applicant),
+                    selectinload(JobApplication.screen),
+                )
+            )
+        )
+        row = self._session.execute(statement).first()
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Job application not found.",
             )
 
-        if requester.is_superuser:
-            return application
-
-        if application.applicant_id == requester.id:
-            return application
+        application, authorized = row
+        allowed = application if requester.is_superuser or authorized else None
+        self._access_cache[cache_key] = allowed
+        return self._authorized_application(allowed)
 
-        job_listing = self._session.get(JobListing, application.job_listing_id)
-        if job_listing and job_listing.company_id == requester.id:
-            return application
-
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this job application.",
-        )
+    @staticmethod
+    def _authorized_application(application: JobApplication | None) -> JobApplication:
+        if application is None:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not authorized to access this job application.",
+            )
+        return application
 
     def update_status(
         self,
@@ -183,23 +264,14 @@ class JobApplicationService:
         if application.status == new_status:
             return application
 
-        if application.status in self._TERMINAL_STATUSES:
+        transition_error = self._transition_error(application.status, new_status)
+        if transition_error:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Application is in a terminal state and cannot be updated.",
+                detail=transition_error,
             )
 
-        allowed = self._STATUS_TRANSITIONS.get(application.status, set())
-        if new_status not in allowed:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=(
-                    f"Cannot transition application from "
-                    f"{application.status} to {new_status}."
-                ),
-            )
-
-        job_listing = self._session.get(JobListing, application.job_listing_id)
+        job_listing = self._get_listing_access(application.job_listing_id)
         if not requester.is_superuser:
             if not job_listing or job_listing.company_id != requester.id:
                 raise HTTPException(
@@ -209,6 +281,98 @@ class JobApplicationService:
 
         return self._persist_status_change(application, new_status)
 
+    def update_statuses_bulk(
+        self,
+        *,
+        application_ids: list[UUID],
+        requester: User,
+        new_status: JobApplicationStatusEnum,
+    ) -> JobApplicationBulkStatusResult:
+        """
+        Transition several applications to the same status in one UPDATE.
+
+        Applications that are missing, not owned by the requester, or not allowed
+        to make the transition are reported in ``failed`` and left untouched. The
+        UPDATE only applies to rows still in the status the transition was
+        checked against, so a concurrent change is reported rather than
+        overwritten.
+        """
+        rows = self._session.exec(
+            select(JobApplication.id, JobApplication.status, JobListing.company_id)
+            .join(JobListing, JobListing.id == JobApplication.job_listing_id)
+            .where(JobApplication.id.in_(application_ids))
+        ).all()
+        found = {row[0]: (row[1], row[2]) for row in rows}
+
+        updated: list[UUID] = []
+        # Applications to update, grouped by the status they are moving from.
+        pending: dict[JobApplicationStatusEnum, list[UUID]] = {}
+        failed: dict[UUID, str] = {}
+        for application_id in dict.fromkeys(application_ids):
+            if application_id not in found:
+                failed[application_id] = "Job application not found."
+                continue
+
+            current_status, company_id = found[application_id]
+            if not requester.is_superuser and company_id != requester.id:
+                failed[application_id] = (
+                    "Only the owning company may change the status."
+                )
+                continue
+            if current_status == new_status:
+                updated.append(application_id)
+                continue
+
+            transition_error = self._transition_error(current_status, new_status)
+            if transition_error:
+                failed[application_id] = transition_error
+                continue
+
+            updated.append(application_id)
+            pending.setdefault(current_status, []).append(application_id)
+
+        if pending:
+            try:
+                changed = set(
+                    self._session.scalars(
+                        update(JobApplication)
+                        .where(
+                            or_(
+                                *(
+                                    and_(
+                                        JobApplication.status == source_status,
+                                        JobApplication.id.in_(source_ids),
+                                    )
+                                    for source_status, source_ids in pending.items()
+                                )
+                            )
+                        )
+                        .values(status=new_status, updated_at=func.now())
+                        .returning(JobApplication.id)
+                    )
+                )
+                self._session.commit()
+            except Exception as exc:  # pragma: no cover
+                self._session.rollback()
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"Failed to update application statuses: {exc}",
+                ) from exc
+
+            for source_ids in pending.values():
+                for application_id in source_ids:
+                    if application_id not in changed:
+                        failed[application_id] = (
+                            "The application status changed concurrently."
+                        )
+            updated = [
+                application_id
+                for application_id in updated
+                if application_id not in failed
+            ]
+
+        return JobApplicationBulkStatusResult(updated=updated, failed=failed)
+
     def withdraw_application(
         self,
         *,
@@ -238,6 +402,156 @@ class JobApplicationService:
             application, JobApplicationStatusEnum.WITHDRAWN
         )
 
+    def _visible_applications_query(self, requester: User) -> StatementLambdaElement:
+        """
+        Build the newest-first query of applications the requester may see.
+
+        Built as a lambda statement so each variant's construct is cached across
+        requests; the requester id is tracked as a bound parameter.
+        """
+        requester_id = requester.id
+        if requester.is_superuser:
+            return lambda_stmt(
+                lambda: (
+                    select(JobApplication)
+                    .options(
+                        *_READ_LOAD_OPTIONS, selectinload(JobApplication.job_listing)
+                    )
+                    .order_by(JobApplication.created_at.desc())
+                )
+            )
+
+        if requester.role == UserRoleEnum.COMPANY:
+            return lambda_stmt(
+                lambda: (
+                    select(JobApplication)
+                    .join(JobListing, JobListing.id == JobApplication.job_listing_id)
+                    .options(
+                        *_READ_LOAD_OPTIONS, contains_eager(JobApplication.job_listing)
+                    )
+                    .where(JobListing.company_id == requester_id)
+                    .order_by(JobApplication.created_at.desc())
+                )
+            )
+
+        return lambda_stmt(
+            lambda: (
+                select(JobApplication)
+                .options(*_READ_LOAD_OPTIONS, selectinload(JobApplication.job_listing))
+                .where(JobApplication.applicant_id == requester_id)
+                .order_by(JobApplication.created_at.desc())
+            )
+        )
+
+    def _transition_error(
+        self,
+        current_status: JobApplicationStatusEnum,
+        new_status: JobApplicationStatusEnum,
+    ) -> str | None:
+        """Explain why a status transition is not allowed, if it is not."""
+        if current_status in self._TERMINAL_STATUSES:
+            return "Application is in a terminal state and cannot be updated."
+
+        if (current_status, new_status) not in self._ALLOWED_PAIRS:
+            return (
+                f"Cannot transition application from {current_status} to {new_status}."
+            )
+        return None
+
+    def _insert_submission(
+        self, job_application: JobApplication, applicant: User
+    ) -> Row[tuple[UUID, bool, bool, UUID | None, JobApplication | None]] | None:
+        """
+        Check the submission targets and insert the application in one statement.
+
+        A CTE reads the listing and the owner of the attached resume, and the
+        insert only runs when the listing is active and not past ``expires_on``
+        and the resume may be used.
+        Duplicates are rejected by uq_job_application_listing_applicant through
+        ON CONFLICT DO NOTHING. The returned row carries the targets alongside
+        the inserted application (``None`` when nothing was inserted), or is
+        ``None`` itself when the listing does not exist.
+        """
+        targets = (
+            select(
+                JobListing.company_id,
+                and_(
+                    JobListing.is_active,
+                    or_(
+                        JobListing.expires_on.is_(None),
+                        JobListing.expires_on >= func.current_date(),
+                    ),
+                ).label("accepting_applications"),
+                Resume.user_id.label("resume_owner_id"),
+            )
+            .select_from(JobListing)
+            .outerjoin(Resume, Resume.id == job_application.resume_id)
+            .where(JobListing.id == job_application.job_listing_id)
+            .cte("targets")
+        )
+
+        conditions = [targets.c.accepting_applications]
+        if job_application.resume_id is not None:
+            conditions.append(
+                targets.c.resume_owner_id.is_not(None)
+                if applicant.is_superuser
+                else targets.c.resume_owner_id == applicant.id
+            )
+
+        values = job_application.model_dump()
+        columns = JobApplication.__table__.c
+        inserted = (
+            insert(JobApplication)
+            .from_select(
+                list(values),
+                select(
+                    *(
+                        literal(value, columns[name].type).label(name)
+                        for name, value in values.items()
+                    )
+                )
+                .select_from(targets)
+                .where(*conditions),
+            )
+            .on_conflict_do_nothing(index_elements=["job_listing_id", "applicant_id"])
+            .returning(*columns)
+            .cte("inserted")
+        )
+        created = aliased(JobApplication, inserted, name="created")
+
+        return self._session.execute(
+            select(
+                targets.c.company_id,
+                targets.c.accepting_applications,
+                targets.c.resume_owner_id,
+                created,
+            )
+            .select_from(targets)
+            .outerjoin(inserted, true())
+        ).first()
+
+    def _get_listing_access(self, job_listing_id: UUID) -> _ListingAccess | None:
+        """Return a listing's owner, memoized per process."""
+        with _listing_access_lock:
+            cached = _listing_access_cache.get(job_listing_id)
+        if cached is not None:
+            return cached
+
+        row = self._session.execute(
+            lambda_stmt(
+                lambda: select(JobListing.company_id).where(
+                    JobListing.id == job_listing_id
+                )
+            )
+        ).first()
+        if not row:
+            return None
+
+        access = _ListingAccess(*row)
+        with _listing_access_lock:
+            _listing_access_cache[job_listing_id] = access
+        return access
+
     def _persist_status_change(
         self,
         application: JobApplication,
@@ -249,7 +563,6 @@ class JobApplicationService:
         try:
             self._session.add(application)
             self._session.commit()
-            self._session.refresh(application)
             return application
         except Exception as exc:  # pragma: no cover
             self._session.rollback()
@@ -1,5 +1,7 @@
 """Job application schemas."""
 
+from uuid import UUID
+
 from sqlmodel import SQLModel
 
 from app.models import (
@@ -17,6 +19,20 @@ class JobApplicationStatusUpdate(SQLModel):
     status: JobApplicationStatusEnum
 
 
+class JobApplicationBulkStatusUpdate(SQLModel):
+    """Request body for moving several job applications to one status."""
+
+    application_ids: list[UUID]
+    status: JobApplicationStatusEnum
+
+
+class JobApplicationBulkStatusResult(SQLModel):
+    """Per-application outcome of a bulk status update."""
+
+    updated: list[UUID]
+    failed: dict[UUID, str]
+
+
 __all__ = [
     "JobApplicationStatusEnum",
     "JobApplicationBase",
@@ -24,4 +40,6 @@ __all__ = [
     "JobApplicationCreate",
     "JobApplicationRead",
     "JobApplicationStatusUpdate",
+    "JobApplicationBulkStatusUpdate",
+    "JobApplicationBulkStatusResult",
 ]
@@ -1,11 +1,22 @@
 import logging
+from collections.abc import Iterator
+from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Depends, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlmodel import Session
 
-from app.api.deps import CurrentUser
-from app.services.applications.application import JobApplicationServiceDep
+from app.api.deps import CurrentUser, get_current_active_superuser
+from app.core.db import engine
+from app.services.applications.application import (
+    JobApplicationService,
+    JobApplicationServiceDep,
+)
 from app.services.applications.models import (
+    JobApplicationBulkStatusResult,
+    JobApplicationBulkStatusUpdate,
     JobApplicationCreate,
     JobApplicationRead,
     JobApplicationStatusUpdate,
@@ -15,18 +26,54 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/applications", tags=["applications"])
 
+# Serializes list responses straight to JSON bytes in pydantic-core, skipping
+# FastAPI's response_model encode-then-json.dumps round trip.
+_application_list_adapter = TypeAdapter(list[JobApplicationRead])
+
 
 @router.get("", response_model=list[JobApplicationRead])
-async def list_applications_endpoint(
+def list_applications_endpoint(
     current_user: CurrentUser,
     service: JobApplicationServiceDep,
-) -> list[JobApplicationRead]:
+    skip: int = 0,
+    limit: int = 100,
+    cursor: datetime | None = None,
+) -> Response:
     """List job applications visible to the current user."""
-    return service.list_applications(requester=current_user)
+    applications = service.list_applications(
+        requester=current_user,
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+    )
+    return Response(
+        content=_application_list_adapter.dump_json(
+            _application_list_adapter.validate_python(
+                applications, from_attributes=True
+            )
+        ),
+        media_type="application/json",
+    )
+
+
+@router.get("/export", dependencies=[Depends(get_current_active_superuser)])
+def export_applications_endpoint(current_user: CurrentUser) -> StreamingResponse:
+    """Stream all job applications as newline-delimited JSON."""
+
+    def rows() -> Iterator[str]:
+        # The request session is closed once the endpoint returns, so the
+        # export reads through its own session while the body streams.
+        with Session(engine) as session:
+            service = JobApplicationService(session=session)
+            for application in service.export_applications(requester=current_user):
+                yield JobApplicationRead.model_validate(application).model_dump_json()
+                yield "\n"
+
+    return StreamingResponse(rows(), media_type="application/x-ndjson")
 
 
 @router.get("/{application_id}", response_model=JobApplicationRead)
-async def get_application_endpoint(
+def get_application_endpoint(
     application_id: UUID,
     current_user: CurrentUser,
     service: JobApplicationServiceDep,
@@ -39,7 +86,7 @@ async def get_application_endpoint(
 
 
 @router.post("", response_model=JobApplicationRead, status_code=status.HTTP_201_CREATED)
-async def submit_application_endpoint(
+def submit_application_endpoint(
     payload: JobApplicationCreate,
     current_user: CurrentUser,
     service: JobApplicationServiceDep,
@@ -52,7 +99,7 @@ async def submit_application_endpoint(
     "/{application_id}/status",
     response_model=JobApplicationRead,
 )
-async def update_application_status_endpoint(
+def update_application_status_endpoint(
     application_id: UUID,
     payload: JobApplicationStatusUpdate,
     current_user: CurrentUser,
@@ -87,8 +134,22 @@ async def update_application_status_endpoint(
         raise
 
 
+@router.put("/status", response_model=JobApplicationBulkStatusResult)
+def update_application_statuses_endpoint(
+    payload: JobApplicationBulkStatusUpdate,
+    current_user: CurrentUser,
+    service: JobApplicationServiceDep,
+) -> JobApplicationBulkStatusResult:
+    """Transition several applications to one status, reporting per-id results."""
+    return service.update_statuses_bulk(
+        application_ids=payload.application_ids,
+        requester=current_user,
+        new_status=payload.status,
+    )
+
+
 @router.post("/{application_id}/withdraw", response_model=JobApplicationRead)
-async def withdraw_application_endpoint(
+def withdraw_application_endpoint(
     application_id: UUID,
     current_user: CurrentUser,
     service: JobApplicationServiceDep,
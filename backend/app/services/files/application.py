@@ -1,17 +1,23 @@
 from __future__ import annotations
 
+import logging
+import os
 from typing import Annotated, BinaryIO
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from fastapi import Depends, HTTPException, UploadFile
-from sqlmodel import Session
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, func, select
 
 from app.api.deps import SessionDep
+from app.core.db import engine
 from app.models import User
 from app.services.files.models import File
-from app.services.storage.base import StorageService
+from app.services.storage.base import StorageService, StoredObject
 from app.services.storage.deps import StorageServiceDep
 
+logger = logging.getLogger(__name__)
+
 
 class FileApplicationService:
     """Application service that orchestrates file storage and metadata operations."""
@@ -20,56 +26,104 @@ class FileApplicationService:
         self._session = session
         self._storage = storage
 
-    def upload_file(self, *, file: UploadFile, owner: User) -> File:
-        storage_key: str | None = None
-
-        file_id = uuid4()
-        storage_filename = str(file_id)
-
+    def upload_file(
+        self,
+        *,
+        file: UploadFile,
+        owner: User,
+        commit: bool = True,
+    ) -> File:
+        """
+        Store an upload under its content hash and record it for the owner.
+
+        The content is hashed while it is written, and saving content that is
+        already stored just replaces it with the same bytes. Re-uploading the
+        same content returns the owner's existing file record. With
+        ``commit=False`` the record is written in the caller's transaction; a
+        caller that then rolls back should call ``release_storage`` for the
+        file's storage key.
+        """
+        return self.upload_files(files=[file], owner=owner, commit=commit)[0]
+
+    def upload_files(
+        self,
+        *,
+        files: list[UploadFile],
+        owner: User,
+        commit: bool = True,
+    ) -> list[File]:
+        """
+        Store several uploads and record them for the owner in one transaction.
+
+        Behaves like ``upload_file`` for each upload. The storage key locks are
+        taken in key order, so concurrent batches that share content cannot
+        deadlock; the records are returned in the order of ``files``.
+        """
+        stored_objects: list[StoredObject] = []
         try:
-            storage_key = self._storage.save(
-                file_data=file.file, filename=storage_filename
-            )
+            for file in files:
+                file.file.seek(0)
+                stored_objects.append(self._storage.save(file_data=file.file))
         except Exception as exc:  # pragma: no cover - propagated as HTTP error
+            for stored in stored_objects:
+                self.release_storage(stored.key)
             raise HTTPException(
                 status_code=500,
                 detail=f"Storage service failed to save file: {exc}",
             ) from exc
 
         try:
-            file_metadata = File(
-                id=file_id,
-                filename=file.filename,
-                content_type=file.content_type,
-                size_bytes=file.size,
-                storage_key=storage_key,
-                owner_id=owner.id,
-            )
-            db_file = File.model_validate(file_metadata)
-
-            self._session.add(db_file)
-            self._session.commit()
-            self._session.refresh(db_file)
-            return db_file
+            for storage_key in sorted({stored.key for stored in stored_objects}):
+                _lock_storage_key(self._session, storage_key)
+
+            db_files = []
+            for file, stored in zip(files, stored_objects, strict=True):
+                # A concurrent release may have removed the object after it was
+                # saved and before the lock was taken; it stays in place once
+                # locked.
+                if not self._storage.exists(stored.key):
+                    file.file.seek(0)
+                    self._storage.save(file_data=file.file)
+
+                file_metadata = File.model_validate(
+                    File(
+                        filename=file.filename,
+                        content_type=file.content_type,
+                        size_bytes=stored.size,
+                        storage_key=stored.key,
+                        sha256=stored.sha256,
+                        owner_id=owner.id,
+                    )
+                )
+                upsert_statement = (
+                    insert(File)
+                    .values(file_metadata.model_dump())
+                    .on_conflict_do_update(
+                        index_elements=["storage_key", "owner_id"],
+                        set_={
+                            "filename": file_metadata.filename,
+                            "content_type": file_metadata.content_type,
+                            "updated_at": file_metadata.updated_at,
+                        },
+                    )
+                    .returning(File)
+                )
+                db_files.append(self._session.scalars(upsert_statement).one())
+            if commit:
+                self._session.commit()
+            return db_files
 
         except Exception as exc:  # pragma: no cover - propagated as HTTP error
-            if storage_key:
-                try:
-                    self._storage.delete(storage_key)
-                except Exception:
-                    # Any cleanup failure is logged and ignored to avoid masking the DB error.
-                    print(  # noqa: T201 - best-effort warning for operators
-                        f"Cleanup warning: failed to delete storage object {storage_key}"
-                    )
             self._session.rollback()
+            for stored in stored_objects:
+                self.release_storage(stored.key)
             raise HTTPException(
                 status_code=500,
                 detail=f"Failed to record file metadata: {exc}",
             ) from exc
 
-    def retrieve_file_stream(
-        self, *, file_id: UUID, requester: User
-    ) -> tuple[File, BinaryIO]:
+    def get_file(self, *, file_id: UUID, requester: User) -> File:
+        """Return file metadata if the requester may access it."""
         db_file = self._session.get(File, file_id)
         if not db_file:
             raise HTTPException(status_code=404, detail="File metadata not found")
@@ -78,10 +132,36 @@ class FileApplicationService:
             raise HTTPException(
                 status_code=403, detail="Not authorized to access this file"
             )
+        return db_file
+
+    def get_file_path(self, db_file: File) -> tuple[str, os.stat_result] | None:
+        """
+        Return the local path and stat of a stored file for serving it directly.
+
+        Returns ``None`` when the storage backend does not keep files on local
+        disk; use ``open_file_stream`` then.
+        """
+        path = self._storage.path_for(db_file.storage_key)
+        if path is None:
+            return None
+        try:
+            return path, os.stat(path)
+        except FileNotFoundError as exc:
+            raise HTTPException(
+                status_code=500,
+                detail="Physical file storage error (file not found in storage).",
+            ) from exc
+
+    def retrieve_file_stream(
+        self, *, file_id: UUID, requester: User
+    ) -> tuple[File, BinaryIO]:
+        db_file = self.get_file(file_id=file_id, requester=requester)
+        return db_file, self.open_file_stream(db_file)
 
+    def open_file_stream(self, db_file: File) -> BinaryIO:
+        """Open the stored content of a file the caller has already authorized."""
         try:
-            file_stream = self._storage.retrieve(db_file.storage_key)
-            return db_file, file_stream
+            return self._storage.retrieve(db_file.storage_key)
         except FileNotFoundError as exc:
             raise HTTPException(
                 status_code=500,
@@ -115,18 +195,53 @@ class FileApplicationService:
                 detail=f"Failed to delete file metadata: {exc}",
             ) from exc
 
+        self.release_storage(storage_key)
+
+    def release_storage(self, storage_key: str) -> None:
+        """
+        Delete a stored object once no file record references it.
+
+        Runs in a session of its own, so changes pending in the caller's session
+        are left alone. Call it after the caller's transaction has ended, since
+        that transaction may hold the storage key lock.
+        """
         try:
-            self._storage.delete(storage_key)
+            with Session(engine) as session:
+                _lock_storage_key(session, storage_key)
+                # Other owners may still reference the same content-addressed
+                # object.
+                shared = session.exec(
+                    select(File.id).where(File.storage_key == storage_key).limit(1)
+                ).first()
+                if shared is None:
+                    self._storage.delete(storage_key)
+                # Ending the transaction releases the storage key lock; leaving
+                # the block without committing rolls it back instead.
+                session.commit()
         except FileNotFoundError:
-            print(
-                f"Warning: File {storage_key} was not found in storage during cleanup."
-            )  # noqa: T201
+            logger.warning(
+                "File %s was not found in storage during cleanup.", storage_key
+            )
         except Exception as exc:  # pragma: no cover - logged best effort
-            print(  # noqa: T201 - log critical storage cleanup failure
-                f"CRITICAL: Failed to delete physical file {storage_key} from storage after DB commit: {exc}"
+            logger.critical(
+                "Failed to delete physical file %s from storage after DB commit: %s",
+                storage_key,
+                exc,
             )
 
 
+def _lock_storage_key(session: Session, storage_key: str) -> None:
+    """
+    Hold a lock on a storage key until the session's transaction ends.
+
+    Recording a file and releasing its stored object both take the lock, so an
+    object is never deleted while a new record for it is being written.
+    """
+    session.exec(
+        select(func.pg_advisory_xact_lock(func.hashtextextended(storage_key, 0)))
+    )
+
+
 def get_file_service(
     session: SessionDep, storage: StorageServiceDep
 ) -> FileApplicationService:
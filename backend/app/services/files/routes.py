@@ -1,8 +1,10 @@
+from datetime import timezone
+from email.utils import format_datetime, parsedate_to_datetime
 from uuid import UUID
 
-from fastapi import APIRouter, UploadFile, status
+from fastapi import APIRouter, Request, Response, UploadFile, status
 from fastapi import File as FastAPIFile
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse, StreamingResponse
 
 from app.api.deps import CurrentUser
 from app.services.files.application import FileServiceDep
@@ -11,8 +13,46 @@ from app.services.files.models import File
 router = APIRouter(prefix="/files", tags=["files"])
 
 
+def _cache_validators(db_file: File) -> dict[str, str]:
+    """Build the ETag/Last-Modified headers for a stored file."""
+    updated_at = db_file.updated_at
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+
+    headers = {
+        "Cache-Control": "private, max-age=3600",
+        "Last-Modified": format_datetime(updated_at, usegmt=True),
+    }
+    if db_file.sha256:
+        headers["ETag"] = f'"{db_file.sha256}"'
+    return headers
+
+
+def _is_not_modified(request: Request, validators: dict[str, str]) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since against the file validators."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        etag = validators.get("ETag")
+        if etag is None:
+            return False
+        candidates = {
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        }
+        return "*" in candidates or etag in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    last_modified = parsedate_to_datetime(validators["Last-Modified"])
+    return last_modified <= since
+
+
 @router.post("", response_model=File)
-async def upload_file_and_create(
+def upload_file_and_create(
     current_user: CurrentUser,
     service: FileServiceDep,
     file: UploadFile = FastAPIFile(...),
@@ -24,29 +64,47 @@ async def upload_file_and_create(
 
 
 @router.get("/{file_id}")
-async def download_file_endpoint(
+def download_file_endpoint(
     file_id: UUID,
+    request: Request,
     current_user: CurrentUser,
     service: FileServiceDep,
 ):
     """
     Retrieves a file by its database ID, performs authorization, and streams the content.
+    Answers 304 Not Modified when the client already holds the current content.
+    Files on local disk are served directly, including byte-range requests.
     """
-    db_file, file_stream = service.retrieve_file_stream(
-        file_id=file_id, requester=current_user
-    )
+    db_file = service.get_file(file_id=file_id, requester=current_user)
+    validators = _cache_validators(db_file)
+    if _is_not_modified(request, validators):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validators)
+
+    local_file = service.get_file_path(db_file)
+    if local_file is not None:
+        path, stat_result = local_file
+        return FileResponse(
+            path,
+            media_type=db_file.content_type,
+            filename=db_file.filename,
+            stat_result=stat_result,
+            headers=validators,
+        )
+
+    file_stream = service.open_file_stream(db_file)
 
     return StreamingResponse(
         file_stream,
         media_type=db_file.content_type,
         headers={
-            "Content-Disposition": f"attachment; filename=\"{db_file.filename.encode('ascii', 'ignore').decode('ascii')}\""
+            "Content-Disposition": f'attachment; filename="{db_file.filename.encode("ascii", "ignore").decode("ascii")}"',
+            **validators,
         },
     )
 
 
 @router.delete("/{file_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_file_endpoint(
+def delete_file_endpoint(
     file_id: UUID,
     current_user: CurrentUser,
     service: FileServiceDep,
@@ -5,10 +5,11 @@ from typing import Annotated
 
 from fastapi import Depends, HTTPException
 from pydantic_ai import Agent
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
 
 from app.api.deps import SessionDep
-from app.core.llm import JobAgentDep
+from app.core.llm import JobAgentDep, arun_job
 from app.services.jobs.models import (
     JobListing,
     JobListingCreate,
@@ -31,16 +32,14 @@ class JobListingApplicationService:
             raise ValueError("Input text must not be empty.")
 
         try:
-            result = await self._job_agent.run(
-                raw_text, output_type=JobListingParseResponse
-            )
+            parsed = await arun_job(raw_text, agent=self._job_agent)
         except Exception as exc:
             raise ValueError("Unable to parse job listing text.") from exc
 
-        if not isinstance(result.output, JobListingParseResponse):
+        if not isinstance(parsed, JobListingParseResponse):
             raise ValueError("Agent returned an unexpected payload.")
 
-        return result.output
+        return parsed
 
     def create_job_listing(
         self, *, listing_in: JobListingCreate, company_id: uuid.UUID
@@ -55,7 +54,6 @@ class JobListingApplicationService:
         try:
             self._session.add(db_listing)
             self._session.commit()
-            self._session.refresh(db_listing)
             return db_listing
         except Exception as exc:  # pragma: no cover - re-raised as HTTP error
             self._session.rollback()
@@ -66,8 +64,15 @@ class JobListingApplicationService:
     def list_job_listings(self) -> list[JobListing]:
         """
         Return all job listings ordered by most recent posting date.
+
+        Applications are batch-loaded for the whole page with one ``IN`` query
+        rather than lazily per listing while the feed is serialized.
         """
-        statement = select(JobListing).order_by(JobListing.posted_on.desc())
+        statement = (
+            select(JobListing)
+            .options(selectinload(JobListing.applications))
+            .order_by(JobListing.posted_on.desc())
+        )
         return list(self._session.exec(statement))
 
 
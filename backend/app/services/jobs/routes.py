@@ -1,27 +1,43 @@
-from fastapi import APIRouter, HTTPException, UploadFile, status
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, Response, UploadFile, status
 from fastapi import File as FastAPIFile
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
 
 from app.api.deps import CompanyUser, CurrentUser
-from app.services.jobs.application import JobListingServiceDep
+from app.services.jobs.application import (
+    JobListingApplicationService,
+    JobListingServiceDep,
+)
 from app.services.jobs.models import (
     JobListingCreate,
     JobListingParseRequest,
     JobListingParseResponse,
     JobListingRead,
 )
-from app.services.parsers import ParserServiceDep
+from app.services.parsers import ParserApplicationService, ParserServiceDep
+from app.services.uploads.application import ChunkedUploadServiceDep
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
+# Validates and serializes the listing feed in one pydantic-core pass instead of
+# FastAPI re-validating every row against the response_model.
+_job_listing_list_adapter = TypeAdapter(list[JobListingRead])
+
 
 @router.get("/listings", response_model=list[JobListingRead])
-async def list_job_listings(
-    service: JobListingServiceDep, _: CurrentUser
-) -> list[JobListingRead]:
+def list_job_listings(service: JobListingServiceDep, _: CurrentUser) -> Response:
     """
     Retrieve all job listings, newest first.
     """
-    return service.list_job_listings()
+    listings = service.list_job_listings()
+    return Response(
+        content=_job_listing_list_adapter.dump_json(
+            _job_listing_list_adapter.validate_python(listings, from_attributes=True)
+        ),
+        media_type="application/json",
+    )
 
 
 @router.post("/listings/parse", response_model=JobListingParseResponse)
@@ -49,7 +65,38 @@ async def parse_job_listing_file(
     """
     Parse an uploaded document into a structured job listing via the LLM agent.
     """
-    parsed = parser_service.parse_file(file=file)
+    return await _parse_job_listing_upload(file, parser_service, service)
+
+
+@router.post(
+    "/listings/parse-upload/{upload_id}", response_model=JobListingParseResponse
+)
+async def parse_job_listing_upload(
+    upload_id: UUID,
+    parser_service: ParserServiceDep,
+    service: JobListingServiceDep,
+    upload_service: ChunkedUploadServiceDep,
+    company_user: CompanyUser,
+) -> JobListingParseResponse:
+    """
+    Parse a chunked upload into a structured job listing via the LLM agent.
+    """
+    file = await run_in_threadpool(
+        upload_service.assemble, upload_id=upload_id, requester=company_user
+    )
+    try:
+        return await _parse_job_listing_upload(file, parser_service, service)
+    finally:
+        file.file.close()
+
+
+async def _parse_job_listing_upload(
+    file: UploadFile,
+    parser_service: ParserApplicationService,
+    service: JobListingApplicationService,
+) -> JobListingParseResponse:
+    # Parsing is blocking and CPU-bound; keep it off the event loop.
+    parsed = await run_in_threadpool(parser_service.parse_file, file=file)
     if not parsed.text.strip():
         raise HTTPException(
             status_code=422, detail="Uploaded job description was empty."
@@ -66,7 +113,7 @@ async def parse_job_listing_file(
     response_model=JobListingRead,
     status_code=status.HTTP_201_CREATED,
 )
-async def create_job_listing(
+def create_job_listing(
     listing_in: JobListingCreate,
     service: JobListingServiceDep,
     company_user: CompanyUser,
@@ -1,47 +1,114 @@
 from __future__ import annotations
 
+import hashlib
+import threading
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, BinaryIO
 
+from cachetools import LRUCache
 from fastapi import Depends, HTTPException, UploadFile
 
 # Trigger parser registrations on import via module side effects.
 import app.services.parsers.parsers  # noqa: F401
+from app.services.parsers.cache import TextCache, text_cache
 from app.services.parsers.models import ParsedDocument
 from app.services.parsers.registry import (
+    SIGNATURE_LENGTH,
+    DocumentParser,
     DocumentParserError,
     ParserRegistry,
     UnsupportedDocumentTypeError,
     parser_registry,
 )
+from app.services.storage.base import CHUNK_SIZE
+
+# Extraction is deterministic on the bytes, so re-uploads of the same document
+# (a resume submitted twice, a job description parsed for preview and again on
+# save) skip the parser entirely. Bounded by the total characters cached; this
+# per-process tier sits in front of the shared on-disk text cache.
+_text_cache: LRUCache[tuple[type[DocumentParser], str], str] = LRUCache(
+    maxsize=64 * 1024 * 1024, getsizeof=len
+)
+# Parsing runs in the threadpool and cachetools caches are not thread-safe.
+_text_cache_lock = threading.Lock()
+
+
+def _digest(file_obj: BinaryIO) -> tuple[str, int]:
+    """Return the SHA-256 hex digest and size of a stream, then rewind it."""
+    file_obj.seek(0)
+    digest = hashlib.sha256()
+    size = 0
+    while chunk := file_obj.read(CHUNK_SIZE):
+        digest.update(chunk)
+        size += len(chunk)
+    file_obj.seek(0)
+    return digest.hexdigest(), size
 
 
 class ParserApplicationService:
     """Application service that orchestrates document parsing."""
 
-    def __init__(self, registry: ParserRegistry | None = None) -> None:
+    def __init__(
+        self,
+        registry: ParserRegistry | None = None,
+        disk_cache: TextCache | None = None,
+    ) -> None:
         self._registry = registry or parser_registry
+        self._disk_cache = disk_cache or text_cache
 
     def parse_file(self, *, file: UploadFile) -> ParsedDocument:
         filename = file.filename or ""
-        extension = Path(filename).suffix.lstrip(".")
         content_type = file.content_type
+        # Normalized once here so the registry lookups are plain dict probes;
+        # MIME parameters such as "; charset=utf-8" are ignored.
+        extension = Path(filename).suffix[1:].lower()
+        mime_type = (content_type or "").partition(";")[0].strip().lower()
 
-        file.file.seek(0)
-        peek = file.file.read(1)
-        if not peek:
+        # One sequential pass checks for an empty upload and fingerprints it for
+        # the text cache and for content-addressed storage downstream.
+        sha256, size_bytes = _digest(file.file)
+        if not size_bytes:
             raise HTTPException(status_code=400, detail="Uploaded file is empty.")
+
+        # Route on the content's magic bytes where the format has them, so a
+        # mislabeled upload reaches the right parser or is rejected up front.
+        head = file.file.read(SIGNATURE_LENGTH)
         file.file.seek(0)
 
         try:
             parser = self._registry.get_parser(
-                extension=extension, mime_type=content_type
+                extension=extension, mime_type=mime_type, head=head
             )
         except UnsupportedDocumentTypeError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
 
+        cache_key = (type(parser), sha256)
+        with _text_cache_lock:
+            text = _text_cache.get(cache_key)
+        if text is None:
+            # Other worker processes may already have extracted these bytes.
+            text = self._disk_cache.get_or_compute(
+                type(parser).__name__,
+                sha256,
+                lambda: self._parse(parser, file.file),
+            )
+            if len(text) <= _text_cache.maxsize:
+                with _text_cache_lock:
+                    _text_cache[cache_key] = text
+
+        return ParsedDocument(
+            filename=filename,
+            content_type=content_type,
+            text=text,
+            sha256=sha256,
+            size_bytes=size_bytes,
+        )
+
+    @staticmethod
+    def _parse(parser: DocumentParser, file_obj: BinaryIO) -> str:
+        """Run a parser, mapping its failures to HTTP errors."""
         try:
-            text = parser.parse(file.file)
+            return parser.parse(file_obj)
         except DocumentParserError as exc:
             raise HTTPException(status_code=422, detail=str(exc)) from exc
         except Exception as exc:  # pragma: no cover - defensive guardrail
@@ -49,12 +116,6 @@ class ParserApplicationService:
                 status_code=500, detail=f"Unexpected parsing failure: {exc}"
             ) from exc
 
-        return ParsedDocument(
-            filename=filename,
-            content_type=content_type,
-            text=text,
-        )
-
 
 def get_parser_service() -> ParserApplicationService:
     return ParserApplicationService()
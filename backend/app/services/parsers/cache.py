@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from uuid import uuid4
+
+from app.services.storage.local_storage import STORAGE_ROOT
+
+__all__ = ["TextCache", "text_cache"]
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever a parser's output changes so stale extractions are not reused.
+TEXT_CACHE_VERSION = "1"
+
+_CACHE_ROOT = Path(STORAGE_ROOT) / ".text-cache" / TEXT_CACHE_VERSION
+# Entries that are not read within this window are removed.
+_TTL_SECONDS = 30 * 24 * 60 * 60
+_PURGE_INTERVAL_SECONDS = 60 * 60
+
+
+class TextCache:
+    """
+    Extracted document text stored on local disk, keyed by content digest.
+
+    The cache is shared by every worker process and every endpoint, so the same
+    bytes are parsed once however often and wherever they are uploaded. It is
+    best effort: disk failures are logged and treated as a miss.
+    """
+
+    def __init__(
+        self, root: Path = _CACHE_ROOT, ttl_seconds: int = _TTL_SECONDS
+    ) -> None:
+        self._root = root
+        self._ttl_seconds = ttl_seconds
+        self._next_purge = 0.0
+        self._purge_lock = threading.Lock()
+
+    def get(self, namespace: str, digest: str) -> str | None:
+        """Return the cached text for ``digest``, or ``None`` on a miss."""
+        path = self._path(namespace, digest)
+        try:
+            text = path.read_text(encoding="utf-8")
+            # Reads refresh the entry so that frequently used text is kept.
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except OSError as exc:
+            logger.warning("Could not read cached text %s: %s", path, exc)
+            return None
+        return text
+
+    def set(self, namespace: str, digest: str, text: str) -> None:
+        """Store the text extracted from the content with ``digest``."""
+        path = self._path(namespace, digest)
+        partial_path = path.with_name(f"{path.name}.{uuid4().hex}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            partial_path.write_text(text, encoding="utf-8")
+            os.replace(partial_path, path)
+        except OSError as exc:
+            partial_path.unlink(missing_ok=True)
+            logger.warning("Could not cache text %s: %s", path, exc)
+        self._purge_expired()
+
+    def get_or_compute(
+        self, namespace: str, digest: str, factory: Callable[[], str]
+    ) -> str:
+        """Return the cached text for ``digest``, extracting and storing it once."""
+        text = self.get(namespace, digest)
+        if text is None:
+            text = factory()
+            self.set(namespace, digest, text)
+        return text
+
+    def _path(self, namespace: str, digest: str) -> Path:
+        return self._root / namespace / digest[:2] / f"{digest}.txt"
+
+    def _purge_expired(self) -> None:
+        """Remove entries that have not been read within the TTL, at most hourly."""
+        now = time.time()
+        with self._purge_lock:
+            if now < self._next_purge:
+                return
+            self._next_purge = now + _PURGE_INTERVAL_SECONDS
+
+        cutoff = now - self._ttl_seconds
+        for path in self._root.glob("*/*/*"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except FileNotFoundError:
+                continue
+            except OSError as exc:
+                logger.warning("Could not purge cached text %s: %s", path, exc)
+
+
+text_cache = TextCache()
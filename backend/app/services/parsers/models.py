@@ -9,3 +9,5 @@ class ParsedDocument(BaseModel):
     filename: str
     content_type: str | None
     text: str
+    sha256: str
+    size_bytes: int
@@ -1,47 +1,316 @@
 from __future__ import annotations
 
-from io import TextIOWrapper
-from typing import BinaryIO
+import math
+import multiprocessing
+import os
+import re
+import threading
+import zipfile
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO, TextIOWrapper
+from typing import IO, Any, BinaryIO
 
+import pypdfium2 as pdfium  # type: ignore[import-untyped]
 from docx import Document  # type: ignore[import-not-found]
+from lxml import etree  # type: ignore[import-untyped]
 from pypdf import PdfReader  # type: ignore[import-not-found]
+from pypdf.generic import (  # type: ignore[import-not-found]
+    DecodedStreamObject,
+    NameObject,
+)
 
+from app.core.config import settings
 from app.services.parsers.registry import (
     DocumentParser,
     DocumentParserError,
     parser_registry,
 )
 
-__all__ = ["PdfDocumentParser", "DocxDocumentParser", "TextDocumentParser"]
+__all__ = [
+    "PdfDocumentParser",
+    "DocxDocumentParser",
+    "TextDocumentParser",
+    "get_pdf_executor",
+    "prewarm_pdf_executor",
+    "shutdown_pdf_executor",
+]
+
+# PDFs with fewer pages are extracted inline; below this the cost of shipping the
+# document to worker processes outweighs the parallel speedup.
+_PARALLEL_PAGE_THRESHOLD = 4
+# Every server worker has its own pool, so by default each gets an even share of
+# the CPUs rather than all of them.
+_PDF_WORKERS = settings.PDF_WORKERS or max(
+    1, (os.cpu_count() or 1) // max(1, settings.BACKEND_WORKERS)
+)
+# PDFs with more pages are sampled before full extraction, so an image-only
+# (scanned) document is rejected without walking every page.
+_SAMPLE_PAGE_THRESHOLD = 5
+
+_pdf_executor: ProcessPoolExecutor | None = None
+_pdf_executor_lock = threading.Lock()
+
+
+def get_pdf_executor() -> ProcessPoolExecutor:
+    """Return the process pool used for PDF page extraction, creating it once."""
+    global _pdf_executor
+    with _pdf_executor_lock:
+        if _pdf_executor is None:
+            # Spawned rather than forked: the server process runs threads, and a
+            # forked child could inherit a lock held by one of them.
+            _pdf_executor = ProcessPoolExecutor(
+                max_workers=_PDF_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pdf_executor
+
+
+def _warm_up_worker() -> None:
+    """Do nothing; unpickling this call makes a worker import the parsers."""
+
+
+def prewarm_pdf_executor() -> None:
+    """
+    Start the PDF worker processes and load the parser modules in each one.
+
+    Called at startup so the first large PDF does not wait for workers to spawn
+    and import PDFium, pypdf, and python-docx.
+    """
+    if _PDF_WORKERS < 2:
+        return
+    executor = get_pdf_executor()
+    # The pool starts a new worker for each task submitted while none is idle.
+    wait([executor.submit(_warm_up_worker) for _ in range(_PDF_WORKERS)])
+
+
+def shutdown_pdf_executor() -> None:
+    """Stop the PDF worker processes, if they were started."""
+    global _pdf_executor
+    with _pdf_executor_lock:
+        executor, _pdf_executor = _pdf_executor, None
+    if executor is not None:
+        executor.shutdown()
+
+
+def _discard_pdf_executor(executor: ProcessPoolExecutor) -> None:
+    """Drop a broken process pool so the next PDF starts a fresh one."""
+    global _pdf_executor
+    with _pdf_executor_lock:
+        if _pdf_executor is executor:
+            _pdf_executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+# PDFium is not thread-safe, so calls into it are serialized within a process.
+_pdfium_lock = threading.Lock()
+
+
+def _pdfium_page_count(pdf_bytes: bytes) -> int:
+    with _pdfium_lock:
+        pdf = pdfium.PdfDocument(pdf_bytes)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+
+
+def _extract_pdfium_pages(pdf_bytes: bytes, start: int, stop: int) -> list[str]:
+    """Extract the text of pages ``start`` to ``stop`` with PDFium."""
+    with _pdfium_lock:
+        pdf = pdfium.PdfDocument(pdf_bytes)
+        try:
+            return [_pdfium_page_text(pdf, index) for index in range(start, stop)]
+        finally:
+            pdf.close()
+
+
+def _pdfium_page_text(pdf: Any, index: int) -> str:
+    try:
+        text: str = pdf[index].get_textpage().get_text_range()
+    except pdfium.PdfiumError as exc:  # pragma: no cover - defensive guardrail
+        raise DocumentParserError(
+            f"Failed to extract text from PDF page {index + 1}: {exc}"
+        ) from exc
+    return text.replace("\r\n", "\n")
+
+
+# Path construction, painting, and colour operators (with their operands) never
+# produce text but dominate the content streams of graphics-heavy pages. String
+# literals, comments, and inline images are matched first and kept verbatim so
+# their bytes are never mistaken for operators.
+_PDF_OPERAND = rb"(?:[+-]?(?:\d+\.?\d*|\.\d+)|/[^\s/\[\]()<>{}%]*|\[[^\[\]()<>]*\])"
+_PDF_GRAPHICS_OPERATOR = (
+    rb"(?:re|rg|RG|cs|CS|scn|SCN|sc|SC|ri|sh|f\*|B\*|b\*|W\*|"
+    rb"[mlcvyhSsfFBbnWgGkKdwJjMi])"
+)
+_PDF_GRAPHICS = re.compile(
+    rb"(?P<keep>\((?:[^()\\]|\\.|\((?:[^()\\]|\\.)*\))*\)"
+    rb"|<[0-9A-Fa-f\s]*>|%[^\r\n]*|\bBI\b.*?\bID\s.*?\sEI\b)"
+    rb"|(?<![^\s\]\)>])(?:"
+    + _PDF_OPERAND
+    + rb"\s+)*"
+    + _PDF_GRAPHICS_OPERATOR
+    + rb"(?![^\s\[\]()<>/{}%])",
+    re.DOTALL,
+)
+
+
+def _strip_graphics(content: bytes) -> bytes:
+    """Drop graphics-only operators from a page content stream."""
+    return _PDF_GRAPHICS.sub(lambda match: match.group("keep") or b"", content)
+
+
+def _extract_pypdf_pages(pdf_bytes: bytes, start: int, stop: int) -> list[str]:
+    """Extract the text of pages ``start`` to ``stop`` with pypdf."""
+    reader = PdfReader(BytesIO(pdf_bytes))
+    return [
+        _pypdf_page_text(reader.pages[index], index + 1) for index in range(start, stop)
+    ]
+
+
+def _pypdf_page_text(page: Any, page_number: int) -> str:
+    try:
+        original = page.get(NameObject("/Contents"))
+        contents = page.get_contents()
+        if contents is not None:
+            raw = contents.get_data()
+            stripped = DecodedStreamObject()
+            stripped.set_data(_strip_graphics(raw))
+            page[NameObject("/Contents")] = stripped
+
+        text = page.extract_text() or ""
+        if not text and contents is not None and b"BT" in raw:
+            # The text-only stream came back empty, so extract from the original.
+            page[NameObject("/Contents")] = original
+            text = page.extract_text() or ""
+        return text
+    except Exception as exc:  # pragma: no cover - defensive guardrail
+        raise DocumentParserError(
+            f"Failed to extract text from PDF page {page_number}: {exc}"
+        ) from exc
+
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_P, _W_R, _W_T = f"{_W}p", f"{_W}r", f"{_W}t"
+_W_TEXTBOX = f"{_W}txbxContent"
+# Run children that python-docx renders as whitespace.
+_W_RUN_BREAKS = {f"{_W}tab": "\t", f"{_W}br": "\n", f"{_W}cr": "\n"}
+_DOCX_MAIN_PART = "word/document.xml"
+
+
+def _docx_paragraphs(document_xml: IO[bytes]) -> list[str]:
+    """
+    Stream the text of each non-empty paragraph out of a DOCX main document part.
+
+    Runs are joined the way python-docx renders them, without building its
+    object model. Text boxes are skipped: Word stores each one twice, once per
+    rendering fallback.
+    """
+    paragraphs: list[str] = []
+    runs: list[str] = []
+    textbox_depth = 0
+    for event, elem in etree.iterparse(
+        document_xml,
+        events=("start", "end"),
+        tag=(_W_P, _W_T, _W_TEXTBOX, *_W_RUN_BREAKS),
+        resolve_entities=False,
+    ):
+        if elem.tag == _W_TEXTBOX:
+            textbox_depth += 1 if event == "start" else -1
+        elif event == "start" or textbox_depth:
+            continue
+        elif elem.tag == _W_P:
+            if text := "".join(runs):
+                paragraphs.append(text)
+            runs.clear()
+            elem.clear()
+        elif elem.tag == _W_T:
+            runs.append(elem.text or "")
+        elif elem.getparent().tag == _W_R:
+            # Tab stops in paragraph properties share the w:tab tag.
+            runs.append(_W_RUN_BREAKS[elem.tag])
+    return paragraphs
 
 
 @parser_registry.register(
     extensions=["pdf"],
     mime_types=["application/pdf"],
+    signatures=[b"%PDF-"],
 )
 class PdfDocumentParser(DocumentParser):
-    """Extracts plain text from PDF documents."""
+    """Extracts plain text from PDF documents with PDFium, falling back to pypdf."""
 
     def parse(self, file_obj: BinaryIO) -> str:
-        try:
-            file_obj.seek(0)
-            reader = PdfReader(file_obj)
-        except Exception as exc:  # pragma: no cover - defensive guardrail
-            raise DocumentParserError(f"Unable to open PDF document: {exc}") from exc
+        file_obj.seek(0)
+        pdf_bytes = file_obj.read()
 
-        texts: list[str] = []
-        for page_number, page in enumerate(reader.pages, start=1):
+        try:
+            page_count = _pdfium_page_count(pdf_bytes)
+            extract_pages = _extract_pdfium_pages
+        except pdfium.PdfiumError:
+            # Fall back to pypdf for documents PDFium refuses to open.
             try:
-                page_text = page.extract_text() or ""
+                page_count = len(PdfReader(BytesIO(pdf_bytes)).pages)
             except Exception as exc:  # pragma: no cover - defensive guardrail
                 raise DocumentParserError(
-                    f"Failed to extract text from PDF page {page_number}: {exc}"
+                    f"Unable to open PDF document: {exc}"
                 ) from exc
+            extract_pages = _extract_pypdf_pages
+
+        if page_count > _SAMPLE_PAGE_THRESHOLD and not self._has_sampled_text(
+            extract_pages, pdf_bytes, page_count
+        ):
+            raise DocumentParserError("PDF appears to be image-only; OCR required.")
+
+        if page_count < _PARALLEL_PAGE_THRESHOLD or _PDF_WORKERS < 2:
+            page_texts = extract_pages(pdf_bytes, 0, page_count)
+        else:
+            page_texts = self._extract_parallel(extract_pages, pdf_bytes, page_count)
 
-            if page_text:
-                texts.append(page_text)
+        return "\n".join(text for text in page_texts if text).strip()
 
-        return "\n".join(texts).strip()
+    @staticmethod
+    def _has_sampled_text(
+        extract_pages: Callable[[bytes, int, int], list[str]],
+        pdf_bytes: bytes,
+        page_count: int,
+    ) -> bool:
+        """Return whether the first, middle, or last page has any text."""
+        return any(
+            text.strip()
+            for index in (0, page_count // 2, page_count - 1)
+            for text in extract_pages(pdf_bytes, index, index + 1)
+        )
+
+    @staticmethod
+    def _extract_parallel(
+        extract_pages: Callable[[bytes, int, int], list[str]],
+        pdf_bytes: bytes,
+        page_count: int,
+    ) -> list[str]:
+        """
+        Split the pages into contiguous ranges and extract them concurrently.
+
+        A worker that dies mid-extraction (a crash or OOM in PDFium) breaks the
+        pool; it is replaced for later documents, and this one is rejected rather
+        than retried in the server process, where it could crash it as well.
+        """
+        step = math.ceil(page_count / _PDF_WORKERS)
+        starts = range(0, page_count, step)
+        stops = [min(start + step, page_count) for start in starts]
+        executor = get_pdf_executor()
+        try:
+            chunks = list(
+                executor.map(extract_pages, [pdf_bytes] * len(starts), starts, stops)
+            )
+        except BrokenProcessPool as exc:
+            _discard_pdf_executor(executor)
+            raise DocumentParserError(
+                "PDF extraction failed; the document could not be processed."
+            ) from exc
+        return [text for chunk in chunks for text in chunk]
 
 
 @parser_registry.register(
@@ -49,20 +318,33 @@ class PdfDocumentParser(DocumentParser):
     mime_types=[
         "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
     ],
+    # DOCX is a ZIP package; other ZIP archives fail fast when the main
+    # document part cannot be found.
+    signatures=[b"PK\x03\x04"],
 )
 class DocxDocumentParser(DocumentParser):
     """Extracts plain text from DOCX documents."""
 
     def parse(self, file_obj: BinaryIO) -> str:
+        try:
+            file_obj.seek(0)
+            with zipfile.ZipFile(file_obj) as archive:
+                if _DOCX_MAIN_PART in archive.namelist():
+                    with archive.open(_DOCX_MAIN_PART) as document_xml:
+                        lines = _docx_paragraphs(document_xml)
+                    return "\n".join(lines).strip()
+        except Exception as exc:  # pragma: no cover - defensive guardrail
+            raise DocumentParserError(f"Unable to open DOCX document: {exc}") from exc
+
+        # The main part has a non-standard name; let python-docx find it through
+        # the package relationships.
         try:
             file_obj.seek(0)
             document = Document(file_obj)
         except Exception as exc:  # pragma: no cover - defensive guardrail
             raise DocumentParserError(f"Unable to open DOCX document: {exc}") from exc
 
-        lines: list[str] = [
-            paragraph.text for paragraph in document.paragraphs if paragraph.text
-        ]
+        lines = [paragraph.text for paragraph in document.paragraphs if paragraph.text]
         return "\n".join(lines).strip()
 
 
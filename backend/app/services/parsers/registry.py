@@ -8,6 +8,7 @@ __all__ = [
     "DocumentParser",
     "DocumentParserError",
     "ParserRegistry",
+    "SIGNATURE_LENGTH",
     "UnsupportedDocumentTypeError",
     "parser_registry",
 ]
@@ -31,19 +32,27 @@ class DocumentParser(ABC):
 
 ParserType = TypeVar("ParserType", bound=DocumentParser)
 
+# Number of leading bytes callers pass to ``ParserRegistry.get_parser`` for
+# content sniffing.
+SIGNATURE_LENGTH = 16
+
 
 class ParserRegistry:
     """Registry that maps file identifiers to parser implementations."""
 
     def __init__(self) -> None:
         self._by_extension: dict[str, type[DocumentParser]] = {}
-        self._mime_to_extension: dict[str, str] = {}
+        self._by_mime_type: dict[str, type[DocumentParser]] = {}
+        self._by_signature: dict[bytes, type[DocumentParser]] = {}
+        # Parsers are stateless, so one instance per class is shared.
+        self._instances: dict[type[DocumentParser], DocumentParser] = {}
 
     def register(
         self,
         *,
         extensions: Iterable[str],
         mime_types: Iterable[str] | None = None,
+        signatures: Iterable[bytes] | None = None,
     ) -> Callable[[type[ParserType]], type[ParserType]]:
         normalized_extensions = [ext.lower().lstrip(".") for ext in extensions if ext]
         if not normalized_extensions:
@@ -55,11 +64,15 @@ class ParserRegistry:
             for extension in normalized_extensions:
                 self._by_extension[extension] = parser_cls
 
-            if mime_types:
-                for mime_type in mime_types:
-                    self._mime_to_extension[mime_type.lower()] = normalized_extensions[
-                        0
-                    ]
+            for mime_type in mime_types or ():
+                self._by_mime_type[mime_type.lower()] = parser_cls
+
+            for signature in signatures or ():
+                if len(signature) > SIGNATURE_LENGTH:
+                    raise ValueError(
+                        f"Signatures may not exceed {SIGNATURE_LENGTH} bytes."
+                    )
+                self._by_signature[signature] = parser_cls
 
             return parser_cls
 
@@ -70,30 +83,54 @@ class ParserRegistry:
         *,
         extension: str | None,
         mime_type: str | None,
+        head: bytes | None = None,
     ) -> DocumentParser:
-        parser_cls = self._resolve_parser(extension=extension, mime_type=mime_type)
-        return parser_cls()
+        """
+        Return the parser for a file.
+
+        ``extension`` is expected without the leading dot and ``mime_type``
+        without parameters, both lower-cased, so each lookup is a single probe.
+        When the first ``SIGNATURE_LENGTH`` bytes are given as ``head``, a
+        registered signature takes precedence over the declared type.
+        """
+        parser_cls = self._resolve_parser(
+            extension=extension, mime_type=mime_type, head=head
+        )
+        parser = self._instances.get(parser_cls)
+        if parser is None:
+            parser = self._instances[parser_cls] = parser_cls()
+        return parser
 
     def _resolve_parser(
         self,
         *,
         extension: str | None,
         mime_type: str | None,
+        head: bytes | None,
     ) -> type[DocumentParser]:
+        if head:
+            for signature, signed_cls in self._by_signature.items():
+                if head.startswith(signature):
+                    return signed_cls
+
         parser_cls: type[DocumentParser] | None = None
 
         if extension:
-            parser_cls = self._by_extension.get(extension.lower().lstrip("."))
+            parser_cls = self._by_extension.get(extension)
 
         if parser_cls is None and mime_type:
-            mapped_extension = self._mime_to_extension.get(mime_type.lower())
-            if mapped_extension:
-                parser_cls = self._by_extension.get(mapped_extension)
+            parser_cls = self._by_mime_type.get(mime_type)
 
         if parser_cls is None:
             raise UnsupportedDocumentTypeError(
                 "Unsupported document type; no parser registered."
             )
+        if head is not None and parser_cls in self._by_signature.values():
+            # A binary format whose content does not carry its signature would
+            # only fail later, and more slowly, inside the parser.
+            raise UnsupportedDocumentTypeError(
+                "File content does not match its declared document type."
+            )
         return parser_cls
 
 
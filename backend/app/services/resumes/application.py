@@ -1,16 +1,25 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Annotated
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, UploadFile
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
 
 from app.api.deps import SessionDep
 from app.models import User
 from app.services.files.application import FileApplicationService, FileServiceDep
-from app.services.parsers import ParserApplicationService, ParserServiceDep
-from app.services.resumes.models import Resume
+from app.services.parsers import (
+    ParsedDocument,
+    ParserApplicationService,
+    ParserServiceDep,
+)
+from app.services.resumes.models import Resume, ResumeText
+
+# Upper bound on resumes accepted by a single bulk upload.
+MAX_RESUME_BATCH = 32
 
 
 class ResumeApplicationService:
@@ -28,47 +37,99 @@ class ResumeApplicationService:
 
     def upload_resume(self, *, file: UploadFile, owner: User) -> Resume:
         """Persist an uploaded resume and its parsed text content."""
-        parsed = self._parser_service.parse_file(file=file)
-        if not parsed.text.strip():
-            raise HTTPException(
-                status_code=422,
-                detail="Uploaded resume did not contain any parseable text.",
-            )
+        return self.upload_resumes(files=[file], owner=owner)[0]
 
-        try:
-            file.file.seek(0)
-        except Exception:  # pragma: no cover - UploadFile may not support seek
-            pass
+    def upload_resumes(self, *, files: list[UploadFile], owner: User) -> list[Resume]:
+        """
+        Persist several uploaded resumes in a single transaction.
 
-        stored_file = self._file_service.upload_file(file=file, owner=owner)
+        The file records and resume rows of the whole batch are committed once,
+        rather than twice per resume. If any upload fails, none of them is kept.
+        """
+        if len(files) > MAX_RESUME_BATCH:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {MAX_RESUME_BATCH} resumes can be uploaded at once.",
+            )
 
-        resume = Resume(
-            user_id=owner.id,
-            file_id=stored_file.id,
-            text_content=parsed.text,
-        )
+        parsed_documents = [self._parse_resume(file) for file in files]
 
+        resumes: list[Resume] = []
+        storage_keys: list[str] = []
         try:
-            self._session.add(resume)
+            stored_files = self._file_service.upload_files(
+                files=files,
+                owner=owner,
+                commit=False,
+            )
+            storage_keys = [stored_file.storage_key for stored_file in stored_files]
+
+            for parsed, stored_file in zip(parsed_documents, stored_files, strict=True):
+                # Files are content addressed, so re-uploading an identical resume
+                # resolves to the same file and returns the resume already stored
+                # for it, including one added earlier in this batch.
+                resume = self._session.exec(
+                    select(Resume).where(Resume.file_id == stored_file.id)
+                ).first()
+                if resume is None:
+                    resume = Resume(
+                        user_id=owner.id,
+                        file_id=stored_file.id,
+                        content=ResumeText(text=parsed.text),
+                    )
+                    self._session.add(resume)
+                resumes.append(resume)
+
             self._session.commit()
-            self._session.refresh(resume)
-            return resume
+            return resumes
         except Exception as exc:  # pragma: no cover - re-raised as HTTP error
             self._session.rollback()
-            try:
-                self._file_service.delete_file(file_id=stored_file.id, requester=owner)
-            except Exception:  # pragma: no cover - best effort cleanup
-                pass
+            for storage_key in storage_keys:
+                try:
+                    self._file_service.release_storage(storage_key)
+                except Exception:  # pragma: no cover - best effort cleanup
+                    pass
+            if isinstance(exc, HTTPException):
+                raise
             raise HTTPException(
                 status_code=500,
                 detail=f"Failed to store resume metadata: {exc}",
             ) from exc
 
-    def list_resumes(self, *, requester: User) -> list[Resume]:
-        """List resumes visible to the requester."""
+    def _parse_resume(self, file: UploadFile) -> ParsedDocument:
+        parsed = self._parser_service.parse_file(file=file)
+        if not parsed.text.strip():
+            raise HTTPException(
+                status_code=422,
+                detail="Uploaded resume did not contain any parseable text.",
+            )
+        return parsed
+
+    def list_resumes(
+        self,
+        *,
+        requester: User,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: datetime | None = None,
+        include_text: bool = True,
+    ) -> list[Resume]:
+        """
+        List resumes visible to the requester, newest first.
+
+        Pass the ``created_at`` of the last resume from the previous page as
+        ``cursor`` to page by key instead of scanning past ``skip`` rows. The
+        parsed text of the page is loaded in one query when ``include_text``
+        is set and not read at all otherwise.
+        """
         statement = select(Resume).order_by(Resume.created_at.desc())
+        if include_text:
+            statement = statement.options(selectinload(Resume.content))
         if not requester.is_superuser:
             statement = statement.where(Resume.user_id == requester.id)
+        if cursor is not None:
+            statement = statement.where(Resume.created_at < cursor)
+        statement = statement.offset(skip).limit(limit)
         return list(self._session.exec(statement))
 
     def get_resume(self, *, resume_id: UUID, requester: User) -> Resume:
@@ -1,5 +1,5 @@
 """Re-export resume models from app.models."""
 
-from app.models import Resume, ResumeBase, ResumeRead
+from app.models import Resume, ResumeBase, ResumeRead, ResumeText
 
-__all__ = ["ResumeBase", "Resume", "ResumeRead"]
+__all__ = ["ResumeBase", "Resume", "ResumeRead", "ResumeText"]
@@ -1,3 +1,4 @@
+from datetime import datetime
 from uuid import UUID
 
 from fastapi import APIRouter, UploadFile, status
@@ -6,31 +7,49 @@ from fastapi import File as FastAPIFile
 from app.api.deps import CurrentUser
 from app.services.resumes.application import ResumeServiceDep
 from app.services.resumes.models import ResumeRead
+from app.services.uploads.application import ChunkedUploadServiceDep
 
 router = APIRouter(prefix="/resumes", tags=["resumes"])
 
 
 @router.get("", response_model=list[ResumeRead])
-async def list_resumes_endpoint(
+def list_resumes_endpoint(
     current_user: CurrentUser,
     service: ResumeServiceDep,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: datetime | None = None,
+    include_text: bool = True,
 ) -> list[ResumeRead]:
     """Return resumes accessible to the current user."""
-    return service.list_resumes(requester=current_user)
+    resumes = service.list_resumes(
+        requester=current_user,
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+        include_text=include_text,
+    )
+    if include_text:
+        return resumes
+    return [ResumeRead.model_validate(resume.model_dump()) for resume in resumes]
 
 
 @router.get("/{resume_id}", response_model=ResumeRead)
-async def get_resume_endpoint(
+def get_resume_endpoint(
     resume_id: UUID,
     current_user: CurrentUser,
     service: ResumeServiceDep,
+    include_text: bool = True,
 ) -> ResumeRead:
     """Return a single resume if the requester is authorized."""
-    return service.get_resume(resume_id=resume_id, requester=current_user)
+    resume = service.get_resume(resume_id=resume_id, requester=current_user)
+    if include_text:
+        return resume
+    return ResumeRead.model_validate(resume.model_dump())
 
 
 @router.post("", response_model=ResumeRead, status_code=status.HTTP_201_CREATED)
-async def upload_resume_endpoint(
+def upload_resume_endpoint(
     current_user: CurrentUser,
     service: ResumeServiceDep,
     file: UploadFile = FastAPIFile(...),
@@ -39,8 +58,41 @@ async def upload_resume_endpoint(
     return service.upload_resume(file=file, owner=current_user)
 
 
+@router.post(
+    "/batch",
+    response_model=list[ResumeRead],
+    status_code=status.HTTP_201_CREATED,
+)
+def upload_resumes_endpoint(
+    current_user: CurrentUser,
+    service: ResumeServiceDep,
+    files: list[UploadFile] = FastAPIFile(...),
+) -> list[ResumeRead]:
+    """Upload several resumes at once; either all of them are stored or none."""
+    return service.upload_resumes(files=files, owner=current_user)
+
+
+@router.post(
+    "/uploads/{upload_id}",
+    response_model=ResumeRead,
+    status_code=status.HTTP_201_CREATED,
+)
+def finalize_resume_upload_endpoint(
+    upload_id: UUID,
+    current_user: CurrentUser,
+    service: ResumeServiceDep,
+    upload_service: ChunkedUploadServiceDep,
+) -> ResumeRead:
+    """Create a resume from a chunked upload once all of its chunks are sent."""
+    file = upload_service.assemble(upload_id=upload_id, requester=current_user)
+    try:
+        return service.upload_resume(file=file, owner=current_user)
+    finally:
+        file.file.close()
+
+
 @router.delete("/{resume_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_resume_endpoint(
+def delete_resume_endpoint(
     resume_id: UUID,
     current_user: CurrentUser,
     service: ResumeServiceDep,
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import re
+
+__all__ = ["extract_relevant_sections"]
+
+# Headings the screening agent needs to evaluate qualifications.
+_RELEVANT_SECTION = re.compile(
+    r"experience|employment|work history|education|skills|projects|"
+    r"certifications?|licen[cs]es?",
+    re.IGNORECASE,
+)
+
+# A heading is either a markdown heading or a short line naming a common resume
+# section, optionally followed by a colon.
+_SECTION_HEADING = re.compile(
+    r"^[ \t]*(?:(?P<hashes>#+)[ \t]*(?P<markdown>[^\n]+?)|"
+    r"[*_]*(?P<plain>(?:[A-Za-z&/]+[ \t]+){0,3}"
+    r"(?:experience|employment|history|education|skills|projects|"
+    r"certifications?|licen[cs]es?|summary|objective|profile|contact|"
+    r"interests|hobbies|references|awards|volunteering|languages|publications))[*_]*)"
+    r"[ \t]*:?[ \t]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Horizontal rules that separate sections in markdown resumes.
+_TRAILING_RULE = re.compile(r"(?:\n[ \t]*[-*_]{3,}[ \t]*)+$")
+
+
+def extract_relevant_sections(text: str) -> str:
+    """
+    Return only the resume sections that matter for screening.
+
+    Keeps experience, education, skills, project, and certification blocks and
+    drops the rest (contact details, hobbies, references). A block runs until
+    the next heading of the same or a higher level, so sub-headings such as job
+    titles stay inside their section. The original text is returned unchanged
+    when no relevant section with content is recognised.
+    """
+    headings = list(_SECTION_HEADING.finditer(text))
+    blocks: list[str] = []
+    kept_until = 0
+    for index, heading in enumerate(headings):
+        title = heading.group("markdown") or heading.group("plain")
+        if heading.start() < kept_until or not _RELEVANT_SECTION.search(title):
+            continue
+        level = _heading_level(heading)
+        end = next(
+            (
+                following.start()
+                for following in headings[index + 1 :]
+                if _heading_level(following) <= level
+            ),
+            len(text),
+        )
+        kept_until = end
+        block = text[heading.start() : end].strip()
+        blocks.append(_TRAILING_RULE.sub("", block))
+
+    if not any(block.partition("\n")[2].strip() for block in blocks):
+        return text
+    return "\n\n".join(blocks)
+
+
+def _heading_level(heading: re.Match[str]) -> int:
+    """Return a heading's depth; plain section names rank as top level."""
+    hashes = heading.group("hashes")
+    return len(hashes) if hashes else 1
@@ -1,27 +1,56 @@
 from __future__ import annotations
 
-from typing import Annotated, TypedDict
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Annotated, NamedTuple, TypedDict
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from pydantic_ai import Agent
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import joinedload, selectinload
 from sqlmodel import Session, select
 
 from app.api.deps import SessionDep
-from app.core.llm import ScreenAgentDep
+from app.core.db import engine
+from app.core.llm import ScreenAgentDep, arun_screen, screen_batch, screen_input_hash
 from app.models import User, UserRoleEnum
 from app.services.applications.models import JobApplication, JobApplicationStatusEnum
 from app.services.jobs.models import JobListing
-from app.services.resumes.models import Resume
+from app.services.resumes.sectioning import extract_relevant_sections
 from app.services.screens.models import (
     JobApplicationScreen,
     JobApplicationScreenAgentPayload,
+    JobApplicationScreenBatchCreate,
+    JobApplicationScreenBatchResult,
     JobApplicationScreenCreate,
     JobApplicationScreenUpdate,
     ScreeningReason,
     ScreeningReasonStatusEnum,
 )
 
+# Largest number of applications screened in one request.
+MAX_SCREEN_BATCH = 32
+
+# Stored agent results are reused for identical inputs for this long.
+_SCREEN_REUSE_TTL = timedelta(days=30)
+
+# Screenings being generated in this process, by application. Concurrent
+# requests for the same application wait on the running screening instead of
+# starting another agent run.
+_inflight_screenings: dict[UUID, asyncio.Task[None]] = {}
+
+
+class _ScreeningInputs(NamedTuple):
+    application: JobApplication
+    # Resume sections sent to the agent and their fingerprint.
+    resume_text: str
+    input_hash: str
+    # Results stored for identical inputs, when there are any.
+    stored_results: JobApplicationScreenAgentPayload | None
+
 
 class JobApplicationScore(TypedDict):
     minimum_score: float
@@ -36,15 +65,28 @@ class JobApplicationScore(TypedDict):
 class JobApplicationScreeningService:
     """Service responsible for screening applications against job listings."""
 
+    # A service is built for every request; slots skip the per-instance dict.
+    __slots__ = ("_session", "_screen_agent")
+
     _STATUS_POINTS = {
         ScreeningReasonStatusEnum.HIGHLY_QUALIFIED: 4,
         ScreeningReasonStatusEnum.QUALIFIED: 3,
         ScreeningReasonStatusEnum.MEETS: 2,
         ScreeningReasonStatusEnum.NOT_QUALIFIED: 0,
     }
-    _MAX_STATUS_POINTS = max(_STATUS_POINTS.values())
     _MINIMUM_WEIGHT = 2
     _PREFERRED_WEIGHT = 1
+    # Points per status with each weight applied, built once for the class.
+    _WEIGHTED_POINTS = {
+        weight: {status: points * weight for status, points in status_points.items()}
+        for weight, status_points in (
+            (_MINIMUM_WEIGHT, _STATUS_POINTS),
+            (_PREFERRED_WEIGHT, _STATUS_POINTS),
+        )
+    }
+    _MAX_WEIGHTED_POINTS = {
+        weight: max(points.values()) for weight, points in _WEIGHTED_POINTS.items()
+    }
 
     def __init__(self, session: Session, screen_agent: Agent) -> None:
         self._session = session
@@ -58,15 +100,218 @@ class JobApplicationScreeningService:
     ) -> JobApplicationScreen:
         """
         Generate screening results for a job application.
+
+        Database work runs in the threadpool, so the event loop only ever waits
+        on the screening agent. Concurrent requests for one application share a
+        single screening; each requester is still authorized separately and
+        reads the stored result in its own session.
+        """
+        inputs = await run_in_threadpool(
+            self._prepare_screening,
+            requester=requester,
+            application_id=payload.application_id,
+        )
+        application = inputs.application
+        if application.screen:
+            return application.screen
+
+        task = _inflight_screenings.get(application.id)
+        if task is None:
+            task = self._start_screenings([inputs])
+        # A disconnecting client does not cancel a screening others wait on.
+        await asyncio.shield(task)
+        screens = await run_in_threadpool(self._load_screens, [application.id])
+        return screens[application.id]
+
+    def _start_screenings(self, group: list[_ScreeningInputs]) -> asyncio.Task[None]:
+        """Start screening applications to one listing as a task others can join."""
+        task = asyncio.ensure_future(self._generate_screenings(group))
+        application_ids = [inputs.application.id for inputs in group]
+        for application_id in application_ids:
+            _inflight_screenings[application_id] = task
+
+        def _forget(_: asyncio.Task[None]) -> None:
+            for application_id in application_ids:
+                if _inflight_screenings.get(application_id) is task:
+                    del _inflight_screenings[application_id]
+
+        task.add_done_callback(_forget)
+        return task
+
+    async def _generate_screenings(self, group: list[_ScreeningInputs]) -> None:
+        """
+        Run the screening agent unless results can be reused, then store them.
+
+        Runs as a task shared by every request waiting on the applications, so
+        it stores the results in a session of its own rather than in the
+        session of the request that started it.
+        """
+        try:
+            results = await self._screen_listing_batch(group)
+        except Exception as exc:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Screening agent failed: {exc}",
+            ) from exc
+
+        if not all(
+            isinstance(result, JobApplicationScreenAgentPayload) for result in results
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Screening agent returned an unexpected payload.",
+            )
+
+        await run_in_threadpool(
+            self._store_in_own_session,
+            [
+                (inputs.application.id, result, inputs.input_hash)
+                for inputs, result in zip(group, results, strict=True)
+            ],
+        )
+
+    async def screen_applications(
+        self,
+        *,
+        requester: User,
+        payload: JobApplicationScreenBatchCreate,
+    ) -> JobApplicationScreenBatchResult:
+        """
+        Screen several applications, sending the resumes for a listing together.
+
+        Each listing's resumes go to the agent in one request, so the listing
+        prompt is prefilled once, and listings are screened concurrently within
+        the agent concurrency limit. Applications that cannot be screened are
+        reported in ``failed``; the others are screened regardless.
         """
-        application = self._session.get(JobApplication, payload.application_id)
+        application_ids = list(dict.fromkeys(payload.application_ids))
+        if len(application_ids) > MAX_SCREEN_BATCH:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"At most {MAX_SCREEN_BATCH} applications can be screened at once.",
+            )
+
+        prepared, failed = await run_in_threadpool(
+            self._prepare_screenings,
+            requester=requester,
+            application_ids=application_ids,
+        )
+
+        screens: dict[UUID, JobApplicationScreen] = {}
+        tasks: dict[UUID, asyncio.Task[None]] = {}
+        by_listing: dict[UUID, list[_ScreeningInputs]] = {}
+        for inputs in prepared:
+            application = inputs.application
+            if application.screen:
+                screens[application.id] = application.screen
+            elif application.id in _inflight_screenings:
+                tasks[application.id] = _inflight_screenings[application.id]
+            else:
+                by_listing.setdefault(application.job_listing_id, []).append(inputs)
+
+        for group in by_listing.values():
+            task = self._start_screenings(group)
+            tasks.update((inputs.application.id, task) for inputs in group)
+
+        # A disconnecting client does not cancel screenings others wait on.
+        unique_tasks = list(dict.fromkeys(tasks.values()))
+        outcomes = await asyncio.shield(
+            asyncio.gather(*unique_tasks, return_exceptions=True)
+        )
+        errors = {
+            task: outcome
+            for task, outcome in zip(unique_tasks, outcomes, strict=True)
+            if isinstance(outcome, BaseException)
+        }
+        for application_id, task in tasks.items():
+            if task in errors:
+                error = errors[task]
+                failed[application_id] = (
+                    error.detail
+                    if isinstance(error, HTTPException)
+                    else f"Screening failed: {error}"
+                )
+
+        screens.update(
+            await run_in_threadpool(
+                self._load_screens,
+                [
+                    application_id
+                    for application_id in tasks
+                    if application_id not in failed
+                ],
+            )
+        )
+
+        return JobApplicationScreenBatchResult(
+            screens=[
+                screens[application_id]
+                for application_id in application_ids
+                if application_id in screens
+            ],
+            failed=failed,
+        )
+
+    async def _screen_listing_batch(
+        self, group: list[_ScreeningInputs]
+    ) -> list[JobApplicationScreenAgentPayload]:
+        """Return agent results for applications to one listing, in order."""
+        job_listing = group[0].application.job_listing
+        pending = [inputs for inputs in group if inputs.stored_results is None]
+        if len(pending) == 1:
+            fresh = iter(
+                [
+                    await arun_screen(
+                        job_listing, pending[0].resume_text, agent=self._screen_agent
+                    )
+                ]
+            )
+        else:
+            fresh = iter(
+                await screen_batch(
+                    job_listing, [inputs.resume_text for inputs in pending]
+                )
+                if pending
+                else ()
+            )
+        return [
+            inputs.stored_results if inputs.stored_results is not None else next(fresh)
+            for inputs in group
+        ]
+
+    def _prepare_screenings(
+        self, *, requester: User, application_ids: list[UUID]
+    ) -> tuple[list[_ScreeningInputs], dict[UUID, str]]:
+        """Prepare each screening, collecting why an application was refused."""
+        prepared: list[_ScreeningInputs] = []
+        failed: dict[UUID, str] = {}
+        for application_id in application_ids:
+            try:
+                prepared.append(
+                    self._prepare_screening(
+                        requester=requester, application_id=application_id
+                    )
+                )
+            except HTTPException as exc:
+                failed[application_id] = exc.detail
+        return prepared, failed
+
+    def _prepare_screening(
+        self, *, requester: User, application_id: UUID
+    ) -> _ScreeningInputs:
+        """
+        Authorize a screening and gather its inputs.
+
+        Nothing beyond the application is gathered when it was already screened.
+        """
+        application = self._get_application(application_id, with_resume=True)
         if not application:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Job application not found.",
             )
 
-        job_listing = self._session.get(JobListing, application.job_listing_id)
+        job_listing = application.job_listing
         if not job_listing:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -88,7 +333,7 @@ class JobApplicationScreeningService:
                 detail="Cannot screen an application without an attached resume.",
             )
 
-        resume = self._session.get(Resume, application.resume_id)
+        resume = application.resume
         if not resume:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -105,62 +350,55 @@ class JobApplicationScreeningService:
                 detail="Cannot screen an application using another user's resume.",
             )
 
-        existing_screen = self._session.exec(
-            select(JobApplicationScreen).where(
-                JobApplicationScreen.application_id == application.id
-            )
-        ).first()
-        if existing_screen:
-            return existing_screen
-
-        agent_input = {
-            "job_listing": {
-                "title": job_listing.title,
-                "description": job_listing.description,
-                "minimum_qualifications": job_listing.minimum_qualifications,
-                "preferred_qualifications": job_listing.preferred_qualifications,
-            },
-            "resume": {
-                "text_content": resume.text_content or "",
-            },
-        }
+        if application.screen:
+            return _ScreeningInputs(application, "", "", None)
 
-        print(agent_input)
+        resume_text = extract_relevant_sections(resume.text_content or "")
+        input_hash = screen_input_hash(job_listing, resume_text)
+        return _ScreeningInputs(
+            application,
+            resume_text,
+            input_hash,
+            self._find_reusable_screen(input_hash),
+        )
 
-        try:
-            agent_result = await self._screen_agent.run(
-                user_prompt=str(agent_input),
-                output_type=JobApplicationScreenAgentPayload,
-            )
-            print(agent_result)
-        except Exception as exc:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Screening agent failed: {exc}",
-            ) from exc
+    def _store_screenings(
+        self,
+        screened: list[tuple[UUID, JobApplicationScreenAgentPayload, str]],
+    ) -> None:
+        """
+        Persist agent results and move the applications under review.
 
-        if not isinstance(agent_result.output, JobApplicationScreenAgentPayload):
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Screening agent returned an unexpected payload.",
+        Everything is written in one transaction. Screenings that another worker
+        stored concurrently for the same applications are kept.
+        """
+        screenings = []
+        for application_id, structured_screen, input_hash in screened:
+            screening = JobApplicationScreen(
+                application_id=application_id,
+                minimum_qualifications=structured_screen.minimum_qualifications,
+                preferred_qualifications=structured_screen.preferred_qualifications,
+                input_hash=input_hash,
             )
-
-        structured_screen = agent_result.output
-
-        screening = JobApplicationScreen(
-            application_id=application.id,
-            minimum_qualifications=structured_screen.minimum_qualifications,
-            preferred_qualifications=structured_screen.preferred_qualifications,
-        )
-        self._update_screen_score(screening)
+            self._update_screen_score(screening)
+            screenings.append(screening.model_dump())
 
         try:
-            self._session.add(screening)
-            application.status = JobApplicationStatusEnum.UNDER_REVIEW
-            self._session.add(application)
+            self._session.execute(
+                insert(JobApplicationScreen)
+                .values(screenings)
+                .on_conflict_do_nothing(index_elements=["application_id"])
+            )
+            self._session.execute(
+                update(JobApplication)
+                .where(
+                    JobApplication.id.in_(
+                        [application_id for application_id, _, _ in screened]
+                    )
+                )
+                .values(status=JobApplicationStatusEnum.UNDER_REVIEW)
+            )
             self._session.commit()
-            self._session.refresh(screening)
-            return screening
         except Exception as exc:  # pragma: no cover - re-raised as HTTP error
             self._session.rollback()
             raise HTTPException(
@@ -168,6 +406,81 @@ class JobApplicationScreeningService:
                 detail=f"Failed to store screening results: {exc}",
             ) from exc
 
+    def _store_in_own_session(
+        self,
+        screened: list[tuple[UUID, JobApplicationScreenAgentPayload, str]],
+    ) -> None:
+        """Persist agent results in a session independent of any request."""
+        with Session(engine, expire_on_commit=False) as session:
+            service = JobApplicationScreeningService(session, self._screen_agent)
+            service._store_screenings(screened)
+
+    def _load_screens(
+        self, application_ids: list[UUID]
+    ) -> dict[UUID, JobApplicationScreen]:
+        """
+        Read stored screens and their applications into this session.
+
+        Screens may have been stored by another session, so loaded applications
+        are refreshed with the status set alongside them.
+        """
+        if not application_ids:
+            return {}
+        screens = self._session.exec(
+            select(JobApplicationScreen)
+            .where(JobApplicationScreen.application_id.in_(application_ids))
+            .options(joinedload(JobApplicationScreen.application))
+            .execution_options(populate_existing=True)
+        ).all()
+        return {screen.application_id: screen for screen in screens}
+
+    def _get_application(
+        self, application_id: UUID, *, with_resume: bool = False
+    ) -> JobApplication | None:
+        """
+        Load an application with its listing and screen in a single query.
+
+        ``with_resume`` also loads the resume. Its parsed text is left to load on
+        first use, so checking an application that was already screened does not
+        fetch the text.
+        """
+        options = [
+            joinedload(JobApplication.job_listing),
+            joinedload(JobApplication.screen),
+        ]
+        if with_resume:
+            options.append(joinedload(JobApplication.resume))
+        return self._session.exec(
+            select(JobApplication)
+            .where(JobApplication.id == application_id)
+            .options(*options)
+        ).first()
+
+    def _find_reusable_screen(
+        self, input_hash: str
+    ) -> JobApplicationScreenAgentPayload | None:
+        """
+        Return the agent results stored for identical inputs, if still fresh.
+
+        Another application with the same listing and resume text was already
+        screened, so its results stand in for a new agent run.
+        """
+        screen = self._session.exec(
+            select(JobApplicationScreen)
+            .where(
+                JobApplicationScreen.input_hash == input_hash,
+                JobApplicationScreen.created_at
+                >= datetime.now(timezone.utc) - _SCREEN_REUSE_TTL,
+            )
+            .limit(1)
+        ).first()
+        if screen is None:
+            return None
+        return JobApplicationScreenAgentPayload(
+            minimum_qualifications=screen.minimum_qualifications,
+            preferred_qualifications=screen.preferred_qualifications,
+        )
+
     def save_manual_results(
         self,
         *,
@@ -178,14 +491,14 @@ class JobApplicationScreeningService:
         """
         Allow an authorized company user to edit screening results.
         """
-        application = self._session.get(JobApplication, application_id)
+        application = self._get_application(application_id)
         if not application:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Job application not found.",
             )
 
-        job_listing = self._session.get(JobListing, application.job_listing_id)
+        job_listing = application.job_listing
         if not job_listing:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -198,12 +511,7 @@ class JobApplicationScreeningService:
                 detail="Not authorized to update this screening result.",
             )
 
-        screen = self._session.exec(
-            select(JobApplicationScreen).where(
-                JobApplicationScreen.application_id == application.id
-            )
-        ).first()
-
+        screen = application.screen
         if not screen:
             screen = JobApplicationScreen(application_id=application.id)
             self._session.add(screen)
@@ -223,6 +531,9 @@ class JobApplicationScreeningService:
                 detail="No screening results provided.",
             )
 
+        # Edited results no longer reflect what the agent returned for the inputs.
+        screen.input_hash = None
+        screen.updated_at = datetime.now(timezone.utc)
         self._update_screen_score(screen)
 
         try:
@@ -230,7 +541,6 @@ class JobApplicationScreeningService:
             self._session.add(application)
             self._session.add(screen)
             self._session.commit()
-            self._session.refresh(screen)
             return screen
         except Exception as exc:  # pragma: no cover - re-raised as HTTP error
             self._session.rollback()
@@ -239,43 +549,43 @@ class JobApplicationScreeningService:
                 detail=f"Failed to update screening results: {exc}",
             ) from exc
 
-    def list_screens(self, *, requester: User) -> list[JobApplicationScreen]:
+    def list_screens(
+        self,
+        *,
+        requester: User,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: datetime | None = None,
+    ) -> list[JobApplicationScreen]:
         """
-        Return screening results visible to the requester.
+        Return screening results visible to the requester, newest first.
+
+        Pass the ``created_at`` of the last screen from the previous page as
+        ``cursor`` to page by key instead of scanning past ``skip`` rows.
         """
-        query = select(JobApplicationScreen).order_by(
-            JobApplicationScreen.created_at.desc()
+        query = (
+            select(JobApplicationScreen)
+            .options(selectinload(JobApplicationScreen.application))
+            .order_by(JobApplicationScreen.created_at.desc())
         )
 
-        if requester.is_superuser:
-            return list(self._session.exec(query))
-
-        if requester.role == UserRoleEnum.COMPANY:
-            company_query = (
-                select(JobApplicationScreen)
-                .join(
-                    JobApplication,
-                    JobApplication.id == JobApplicationScreen.application_id,
-                )
-                .join(
-                    JobListing,
-                    JobListing.id == JobApplication.job_listing_id,
-                )
-                .where(JobListing.company_id == requester.id)
-                .order_by(JobApplicationScreen.created_at.desc())
-            )
-            return list(self._session.exec(company_query))
-
-        applicant_query = (
-            select(JobApplicationScreen)
-            .join(
+        if not requester.is_superuser:
+            query = query.join(
                 JobApplication,
                 JobApplication.id == JobApplicationScreen.application_id,
             )
-            .where(JobApplication.applicant_id == requester.id)
-            .order_by(JobApplicationScreen.created_at.desc())
-        )
-        return list(self._session.exec(applicant_query))
+            if requester.role == UserRoleEnum.COMPANY:
+                query = query.join(
+                    JobListing,
+                    JobListing.id == JobApplication.job_listing_id,
+                ).where(JobListing.company_id == requester.id)
+            else:
+                query = query.where(JobApplication.applicant_id == requester.id)
+
+        if cursor is not None:
+            query = query.where(JobApplicationScreen.created_at < cursor)
+        query = query.offset(skip).limit(limit)
+        return list(self._session.exec(query))
 
     def get_screen(
         self,
@@ -286,21 +596,29 @@ class JobApplicationScreeningService:
         """
         Retrieve a single screening result if the requester is authorized.
         """
-        screen = self._session.get(JobApplicationScreen, screen_id)
+        screen = self._session.exec(
+            select(JobApplicationScreen)
+            .where(JobApplicationScreen.id == screen_id)
+            .options(
+                joinedload(JobApplicationScreen.application).joinedload(
+                    JobApplication.job_listing
+                )
+            )
+        ).first()
         if not screen:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Screening result not found.",
             )
 
-        application = self._session.get(JobApplication, screen.application_id)
+        application = screen.application
         if not application:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Associated application is missing.",
             )
 
-        job_listing = self._session.get(JobListing, application.job_listing_id)
+        job_listing = application.job_listing
 
         if requester.is_superuser:
             return screen
@@ -325,48 +643,46 @@ class JobApplicationScreeningService:
         """
         Calculate a weighted score for an application's screening results.
         """
-        application = self._session.get(JobApplication, application_id)
+        application = self._get_application(application_id)
         if not application:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Job application not found.",
             )
 
-        job_listing = self._session.get(JobListing, application.job_listing_id)
+        job_listing = application.job_listing
         if not job_listing:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Job listing not found for this application.",
             )
 
-        if (
-            not requester.is_superuser
-            and requester.id
-            not in {application.applicant_id, job_listing.company_id}
-        ):
+        if not requester.is_superuser and requester.id not in {
+            application.applicant_id,
+            job_listing.company_id,
+        }:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not authorized to score this application.",
             )
 
-        screen = self._session.exec(
-            select(JobApplicationScreen).where(
-                JobApplicationScreen.application_id == application.id
-            )
-        ).first()
-
+        screen = application.screen
         if not screen:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="This application has not been screened yet.",
             )
 
-        score_payload = self._update_screen_score(screen)
+        score_payload = self._calculate_score(screen)
+        # The score is stored whenever results are written, so it is usually
+        # current and the breakdown can be returned without a write.
+        if screen.score == score_payload["match_percentage"]:
+            return score_payload
 
+        screen.score = score_payload["match_percentage"]
         try:
             self._session.add(screen)
             self._session.commit()
-            self._session.refresh(screen)
         except Exception as exc:  # pragma: no cover - re-raised as HTTP error
             self._session.rollback()
             raise HTTPException(
@@ -385,10 +701,9 @@ class JobApplicationScreeningService:
         if not reasons:
             return 0, 0
 
-        score = sum(
-            self._STATUS_POINTS.get(reason.status, 0) * weight for reason in reasons
-        )
-        max_score = len(reasons) * self._MAX_STATUS_POINTS * weight
+        points = self._WEIGHTED_POINTS[weight]
+        score = sum(points[reason.status] for reason in reasons)
+        max_score = len(reasons) * self._MAX_WEIGHTED_POINTS[weight]
         return score, max_score
 
     @staticmethod
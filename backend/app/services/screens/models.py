@@ -1,5 +1,9 @@
 """Re-export screening models from app.models."""
 
+from uuid import UUID
+
+from sqlmodel import SQLModel
+
 from app.models import (
     JobApplicationScreen,
     JobApplicationScreenAgentPayload,
@@ -12,6 +16,20 @@ from app.models import (
     ScreeningReasonStatusEnum,
 )
 
+
+class JobApplicationScreenBatchCreate(SQLModel):
+    """Request payload to screen several applications at once."""
+
+    application_ids: list[UUID]
+
+
+class JobApplicationScreenBatchResult(SQLModel):
+    """Per-application outcome of a batch screening."""
+
+    screens: list[JobApplicationScreenRead]
+    failed: dict[UUID, str]
+
+
 __all__ = [
     "ScreeningReasonStatusEnum",
     "ScreeningReason",
@@ -19,6 +37,8 @@ __all__ = [
     "JobApplicationScreenBase",
     "JobApplicationScreen",
     "JobApplicationScreenCreate",
+    "JobApplicationScreenBatchCreate",
+    "JobApplicationScreenBatchResult",
     "JobApplicationScreenUpdate",
     "JobApplicationScreenRead",
     "JobApplicationScreenAgentPayload",
@@ -1,3 +1,4 @@
+from datetime import datetime
 from uuid import UUID
 
 from fastapi import APIRouter, status
@@ -5,6 +6,8 @@ from fastapi import APIRouter, status
 from app.api.deps import CurrentUser
 from app.services.screens.application import JobApplicationScreeningServiceDep
 from app.services.screens.models import (
+    JobApplicationScreenBatchCreate,
+    JobApplicationScreenBatchResult,
     JobApplicationScreenCreate,
     JobApplicationScreenRead,
     JobApplicationScreenUpdate,
@@ -14,16 +17,21 @@ router = APIRouter(prefix="/screens", tags=["screens"])
 
 
 @router.get("", response_model=list[JobApplicationScreenRead])
-async def list_screens_endpoint(
+def list_screens_endpoint(
     current_user: CurrentUser,
     service: JobApplicationScreeningServiceDep,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: datetime | None = None,
 ) -> list[JobApplicationScreenRead]:
     """Return screening results visible to the current user."""
-    return service.list_screens(requester=current_user)
+    return service.list_screens(
+        requester=current_user, skip=skip, limit=limit, cursor=cursor
+    )
 
 
 @router.get("/{screen_id}", response_model=JobApplicationScreenRead)
-async def get_screen_endpoint(
+def get_screen_endpoint(
     screen_id: UUID,
     current_user: CurrentUser,
     service: JobApplicationScreeningServiceDep,
@@ -46,8 +54,18 @@ async def create_screen_endpoint(
     return await service.screen_application(requester=current_user, payload=payload)
 
 
+@router.post("/batch", response_model=JobApplicationScreenBatchResult)
+async def create_screens_endpoint(
+    payload: JobApplicationScreenBatchCreate,
+    current_user: CurrentUser,
+    service: JobApplicationScreeningServiceDep,
+) -> JobApplicationScreenBatchResult:
+    """Screen several job applications, reporting the ones that failed."""
+    return await service.screen_applications(requester=current_user, payload=payload)
+
+
 @router.put("/application/{application_id}", response_model=JobApplicationScreenRead)
-async def upsert_application_screen_endpoint(
+def upsert_application_screen_endpoint(
     application_id: UUID,
     payload: JobApplicationScreenUpdate,
     current_user: CurrentUser,
@@ -1,6 +1,21 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import BinaryIO
 
+# Read size used when streaming uploads into storage.
+CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class StoredObject:
+    """
+    Result of saving a file: where it lives, how large it is, and its digest.
+    """
+
+    key: str
+    size: int
+    sha256: str
+
 
 class StorageService(ABC):
     """
@@ -8,16 +23,19 @@ class StorageService(ABC):
     """
 
     @abstractmethod
-    def save(self, file_data: BinaryIO, filename: str) -> str:
+    def save(self, file_data: BinaryIO, filename: str | None = None) -> StoredObject:
         """
-        Saves the file data and returns the resulting storage path/key.
+        Streams the file data into storage in chunks.
 
         Args:
             file_data: A file-like object (e.g., the raw content stream).
-            filename: The desired name for the file.
+            filename: The desired name for the file. When omitted, the file is
+                stored under the SHA-256 hex digest of its content, so saving
+                the same content again is idempotent.
 
         Returns:
-            The unique identifier or path where the file was stored.
+            The storage key together with the byte size and SHA-256 hex digest
+            computed while writing.
         """
         pass
 
@@ -28,6 +46,20 @@ class StorageService(ABC):
         """
         pass
 
+    def path_for(self, file_key: str) -> str | None:
+        """
+        Returns the local filesystem path of a stored object, or None when the
+        backend does not keep objects on local disk.
+        """
+        return None
+
+    @abstractmethod
+    def exists(self, file_key: str) -> bool:
+        """
+        Returns True if an object is stored under the given key.
+        """
+        pass
+
     @abstractmethod
     def delete(self, file_key: str) -> bool:
         """
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Annotated
 
 from fastapi import Depends
@@ -5,12 +6,11 @@ from fastapi import Depends
 from app.services.storage.base import StorageService
 from app.services.storage.local_storage import LocalStorageService
 
-storage_service: StorageService = LocalStorageService()
-
 
+@lru_cache(maxsize=1)
 def get_storage_service() -> StorageService:
-    """Dependency provider function."""
-    return storage_service
+    """Dependency provider function; the service is built once per process."""
+    return LocalStorageService()
 
 
 StorageServiceDep = Annotated[StorageService, Depends(get_storage_service)]
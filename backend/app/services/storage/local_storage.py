@@ -1,15 +1,24 @@
 import errno
+import hashlib
+import logging
 import os
-import shutil
+import re
 from pathlib import Path
 from typing import BinaryIO
+from uuid import uuid4
 
 from app.core.config import settings
-from app.services.storage.base import StorageService
+from app.services.storage.base import CHUNK_SIZE, StorageService, StoredObject
 
 BACKEND_ROOT = Path(__file__).resolve().parents[3]
 FALLBACK_STORAGE_ROOT = BACKEND_ROOT / "local_storage"
 
+logger = logging.getLogger(__name__)
+
+# Keys are single path components; a leading dot would reach "..", "." or the
+# hidden working directories kept under the storage root.
+_SAFE_KEY = re.compile(r"(?!\.)[A-Za-z0-9._-]{1,255}")
+
 
 def _normalize_root(raw_root: str | None) -> Path:
     """Return an absolute Path for the configured storage root."""
@@ -30,9 +39,10 @@ def _ensure_directory(path: Path) -> Path:
         if exc.errno in (errno.EROFS, errno.EACCES):
             fallback = FALLBACK_STORAGE_ROOT
             fallback.mkdir(parents=True, exist_ok=True)
-            print(
-                f"Configured storage root '{path}' is not writable; "
-                f"falling back to '{fallback}'."
+            logger.warning(
+                "Configured storage root '%s' is not writable; falling back to '%s'.",
+                path,
+                fallback,
             )
             return fallback
         raise
@@ -50,37 +60,64 @@ class LocalStorageService(StorageService):
 
     def __init__(self, root_dir: str = STORAGE_ROOT):
         self._root_dir = root_dir
-        print(f"LocalStorageService initialized. Root: {self._root_dir}")
+        logger.debug("LocalStorageService initialized. Root: %s", self._root_dir)
 
     def _get_full_path(self, filename: str) -> str:
         """Helper to combine root directory with filename."""
+        if not _SAFE_KEY.fullmatch(filename):
+            raise ValueError(f"Invalid storage key: {filename!r}")
         return os.path.join(self._root_dir, filename)
 
-    def save(self, file_data: BinaryIO, filename: str) -> str:
-        """Saves the file locally."""
-        full_path = self._get_full_path(filename)
-        print(full_path)
-        # Use shutil.copyfileobj for efficient streaming write
-        with open(full_path, "wb") as buffer:
-            shutil.copyfileobj(file_data, buffer)
+    def save(self, file_data: BinaryIO, filename: str | None = None) -> StoredObject:
+        """Saves the file locally, under its SHA-256 digest unless named."""
+        if filename is not None:
+            self._get_full_path(filename)
+        # Stream in chunks, sizing and hashing each chunk as it is written,
+        # into a temporary file that is renamed into place, so concurrent saves of
+        # the same content-addressed key never expose a partial file.
+        partial_path = os.path.join(self._root_dir, f"{uuid4().hex}.part")
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with open(partial_path, "wb") as buffer:
+                while chunk := file_data.read(CHUNK_SIZE):
+                    buffer.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+            sha256 = digest.hexdigest()
+            key = filename if filename is not None else sha256
+            os.replace(partial_path, self._get_full_path(key))
+        except Exception:
+            try:
+                os.remove(partial_path)
+            except FileNotFoundError:
+                pass
+            raise
 
         # For local storage, the key is simply the filename or full path
-        return filename
+        return StoredObject(key=key, size=size, sha256=sha256)
 
     def retrieve(self, file_key: str) -> BinaryIO:
         """Retrieves the file locally. Note: returns a file handle."""
         full_path = self._get_full_path(file_key)
-        if not os.path.exists(full_path):
-            raise FileNotFoundError(f"File not found at key: {file_key}")
-
         # Returns a readable binary stream (file handle)
-        return open(full_path, "rb")
+        try:
+            return open(full_path, "rb")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found at key: {file_key}") from None
+
+    def path_for(self, file_key: str) -> str:
+        """Returns the path of the file locally, so it can be served directly."""
+        return self._get_full_path(file_key)
+
+    def exists(self, file_key: str) -> bool:
+        """Checks for the file locally."""
+        return os.path.exists(self._get_full_path(file_key))
 
     def delete(self, file_key: str) -> bool:
         """Deletes the file locally."""
-        full_path = self._get_full_path(file_key)
-
-        if os.path.exists(full_path):
-            os.remove(full_path)
-            return True
-        return False
+        try:
+            os.remove(self._get_full_path(file_key))
+        except FileNotFoundError:
+            return False
+        return True
@@ -0,0 +1 @@
+"""Chunked upload service package."""
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+from tempfile import SpooledTemporaryFile
+from typing import Annotated
+from uuid import UUID, uuid4
+
+from fastapi import Depends, HTTPException, UploadFile, status
+from starlette.datastructures import Headers
+
+from app.core.config import settings
+from app.models import User
+from app.services.storage.base import CHUNK_SIZE
+from app.services.storage.local_storage import STORAGE_ROOT
+from app.services.uploads.models import ChunkedUploadCreate, ChunkedUploadRead
+
+logger = logging.getLogger(__name__)
+
+# Clients send uploads as numbered chunks of at most this size, which are joined
+# in index order when the upload is finalized.
+UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+# Enough chunks for the largest upload accepted in a single request.
+MAX_UPLOAD_CHUNKS = -(-settings.MAX_UPLOAD_BYTES // UPLOAD_CHUNK_SIZE)
+
+# Reassembled uploads stay in memory up to this size before spilling to disk.
+_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+# Uploads that are not finalized within this window are discarded.
+_STAGING_TTL_SECONDS = 24 * 60 * 60
+# Each user may have at most this many uploads staged at once.
+_MAX_OPEN_UPLOADS_PER_OWNER = 8
+_STAGING_ROOT = Path(STORAGE_ROOT) / ".uploads"
+_MANIFEST = "manifest.json"
+
+
+class ChunkedUploadService:
+    """Stages uploads sent in chunks and reassembles them for parsing."""
+
+    def __init__(self, staging_root: Path = _STAGING_ROOT) -> None:
+        self._staging_root = staging_root
+
+    def create_upload(
+        self, *, upload_in: ChunkedUploadCreate, owner: User
+    ) -> ChunkedUploadRead:
+        """Start a chunked upload owned by ``owner``."""
+        self._purge_expired()
+        if self._count_open_uploads(owner) >= _MAX_OPEN_UPLOADS_PER_OWNER:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many uploads in progress. Finish or discard one first.",
+            )
+
+        upload_id = uuid4()
+        directory = self._staging_root / str(upload_id)
+        directory.mkdir(parents=True)
+        manifest = {
+            "owner_id": str(owner.id),
+            "filename": upload_in.filename,
+            "content_type": upload_in.content_type,
+        }
+        (directory / _MANIFEST).write_text(json.dumps(manifest))
+        return ChunkedUploadRead(
+            upload_id=upload_id, chunk_size=UPLOAD_CHUNK_SIZE, received_chunks=[]
+        )
+
+    def write_chunk(
+        self, *, upload_id: UUID, seq: int, data: bytes, requester: User
+    ) -> ChunkedUploadRead:
+        """
+        Store one chunk of an upload.
+
+        Chunks may arrive in any order, and re-sending a chunk replaces it, so a
+        failed chunk can be retried on its own.
+        """
+        directory, _ = self._open(upload_id, requester)
+        if not 0 <= seq < MAX_UPLOAD_CHUNKS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Chunk index must be between 0 and {MAX_UPLOAD_CHUNKS - 1}.",
+            )
+
+        partial_path = directory / f"{seq}.{uuid4().hex}.tmp"
+        try:
+            partial_path.write_bytes(data)
+            os.replace(partial_path, directory / f"{seq}.part")
+        except FileNotFoundError:
+            # The upload was assembled or discarded while this chunk was written.
+            partial_path.unlink(missing_ok=True)
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Upload not found.",
+            ) from None
+        except Exception:
+            partial_path.unlink(missing_ok=True)
+            raise
+
+        return ChunkedUploadRead(
+            upload_id=upload_id,
+            chunk_size=UPLOAD_CHUNK_SIZE,
+            received_chunks=self._received_chunks(directory),
+        )
+
+    def assemble(self, *, upload_id: UUID, requester: User) -> UploadFile:
+        """
+        Join the chunks of an upload into a single file and discard the staging.
+
+        Fails with 409 when a chunk is missing. The caller owns the returned file
+        and is responsible for closing it.
+        """
+        directory, manifest = self._open(upload_id, requester)
+        received = self._received_chunks(directory)
+        if not received or received != list(range(len(received))):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Upload is missing chunks.",
+            )
+
+        total = sum((directory / f"{seq}.part").stat().st_size for seq in received)
+        if total > settings.MAX_UPLOAD_BYTES:
+            self._remove(directory)
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Uploads may not exceed {settings.MAX_UPLOAD_BYTES} bytes.",
+            )
+
+        buffer = SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE)
+        size = 0
+        for seq in received:
+            with (directory / f"{seq}.part").open("rb") as chunk:
+                shutil.copyfileobj(chunk, buffer, CHUNK_SIZE)
+            size = buffer.tell()
+        buffer.seek(0)
+        self._remove(directory)
+
+        headers = Headers(
+            {"content-type": manifest["content_type"]}
+            if manifest["content_type"]
+            else {}
+        )
+        return UploadFile(
+            file=buffer, size=size, filename=manifest["filename"], headers=headers
+        )
+
+    def discard(self, *, upload_id: UUID, requester: User) -> None:
+        """Abandon an upload and remove its chunks."""
+        directory, _ = self._open(upload_id, requester)
+        self._remove(directory)
+
+    def _open(self, upload_id: UUID, requester: User) -> tuple[Path, dict[str, str]]:
+        """Return the staging directory and manifest of an upload."""
+        directory = self._staging_root / str(upload_id)
+        try:
+            manifest = json.loads((directory / _MANIFEST).read_text())
+        except FileNotFoundError:
+            manifest = None
+
+        if not manifest or (
+            manifest["owner_id"] != str(requester.id) and not requester.is_superuser
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Upload not found.",
+            )
+        return directory, manifest
+
+    @staticmethod
+    def _received_chunks(directory: Path) -> list[int]:
+        return sorted(int(path.stem) for path in directory.glob("*.part"))
+
+    @staticmethod
+    def _remove(directory: Path) -> None:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    def _count_open_uploads(self, owner: User) -> int:
+        """Return how many staged uploads ``owner`` has not yet finalized."""
+        if not self._staging_root.is_dir():
+            return 0
+
+        count = 0
+        for directory in self._staging_root.iterdir():
+            try:
+                manifest = json.loads((directory / _MANIFEST).read_text())
+            except (FileNotFoundError, NotADirectoryError, ValueError):
+                continue
+            if manifest.get("owner_id") == str(owner.id):
+                count += 1
+        return count
+
+    def _purge_expired(self) -> None:
+        """Remove staged uploads that were abandoned before being finalized."""
+        if not self._staging_root.is_dir():
+            return
+
+        cutoff = time.time() - _STAGING_TTL_SECONDS
+        for directory in self._staging_root.iterdir():
+            try:
+                expired = directory.stat().st_mtime < cutoff
+            except FileNotFoundError:
+                continue
+            if expired:
+                logger.info("Discarding abandoned upload %s", directory.name)
+                self._remove(directory)
+
+
+def get_chunked_upload_service() -> ChunkedUploadService:
+    return ChunkedUploadService()
+
+
+ChunkedUploadServiceDep = Annotated[
+    ChunkedUploadService, Depends(get_chunked_upload_service)
+]
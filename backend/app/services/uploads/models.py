@@ -0,0 +1,23 @@
+"""Chunked upload schemas."""
+
+from uuid import UUID
+
+from sqlmodel import Field, SQLModel
+
+
+class ChunkedUploadCreate(SQLModel):
+    """Request body for starting a chunked upload."""
+
+    filename: str = Field(max_length=255)
+    content_type: str | None = Field(default=None, max_length=100)
+
+
+class ChunkedUploadRead(SQLModel):
+    """State of a chunked upload that has not been finalized yet."""
+
+    upload_id: UUID
+    chunk_size: int
+    received_chunks: list[int]
+
+
+__all__ = ["ChunkedUploadCreate", "ChunkedUploadRead"]
@@ -0,0 +1,65 @@
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+
+from app.api.deps import CurrentUser
+from app.services.uploads.application import (
+    UPLOAD_CHUNK_SIZE,
+    ChunkedUploadServiceDep,
+)
+from app.services.uploads.models import ChunkedUploadCreate, ChunkedUploadRead
+
+router = APIRouter(prefix="/uploads", tags=["uploads"])
+
+
+@router.post("", response_model=ChunkedUploadRead, status_code=status.HTTP_201_CREATED)
+def create_upload_endpoint(
+    upload_in: ChunkedUploadCreate,
+    current_user: CurrentUser,
+    service: ChunkedUploadServiceDep,
+) -> ChunkedUploadRead:
+    """
+    Start a chunked upload.
+
+    Send the file as numbered chunks to ``PUT /uploads/{upload_id}/chunks/{seq}``,
+    then finalize it through an endpoint that accepts an ``upload_id``.
+    """
+    return service.create_upload(upload_in=upload_in, owner=current_user)
+
+
+@router.put("/{upload_id}/chunks/{seq}", response_model=ChunkedUploadRead)
+async def upload_chunk_endpoint(
+    upload_id: UUID,
+    seq: int,
+    request: Request,
+    current_user: CurrentUser,
+    service: ChunkedUploadServiceDep,
+) -> ChunkedUploadRead:
+    """Store one chunk of an upload; the request body is the raw chunk bytes."""
+    data = bytearray()
+    async for piece in request.stream():
+        data += piece
+        if len(data) > UPLOAD_CHUNK_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Chunks may not exceed {UPLOAD_CHUNK_SIZE} bytes.",
+            )
+
+    return await run_in_threadpool(
+        service.write_chunk,
+        upload_id=upload_id,
+        seq=seq,
+        data=bytes(data),
+        requester=current_user,
+    )
+
+
+@router.delete("/{upload_id}", status_code=status.HTTP_204_NO_CONTENT)
+def discard_upload_endpoint(
+    upload_id: UUID,
+    current_user: CurrentUser,
+    service: ChunkedUploadServiceDep,
+) -> None:
+    """Abandon an upload that will not be finalized."""
+    service.discard(upload_id=upload_id, requester=current_user)